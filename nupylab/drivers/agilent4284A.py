@@ -0,0 +1,129 @@
+"""Driver for the Agilent 4284A precision LCR meter built on PyMeasure.
+
+Extends the PyMeasure Agilent 4284A driver with batched configuration and list sweeps
+whose results are returned block by block, as the instrument measures at most 10 list
+points per trigger.
+"""
+
+import logging
+from time import sleep
+from typing import Iterator, List, Optional, Sequence, Tuple
+
+from pymeasure.instruments.agilent import agilent4284A
+from pymeasure.instruments.validators import strict_discrete_set, strict_range
+
+log = logging.getLogger(__name__)
+log.addHandler(logging.NullHandler())
+
+
+class Agilent4284A(agilent4284A.Agilent4284A):
+    """Agilent 4284A LCR meter with batched configuration.
+
+    Extends the PyMeasure driver with :meth:`configure`, which sends several settings
+    as a single compound SCPI message instead of one bus transaction per setting, and
+    :meth:`iter_sweep_measurement`, which yields list sweep results as they complete.
+
+    .. code-block:: python
+
+        agilent = Agilent4284A("GPIB::1")
+        agilent.configure(voltage=0.01, mode="ZTR")
+
+    """
+
+    def configure(
+        self,
+        voltage: Optional[float] = None,
+        current: Optional[float] = None,
+        mode: Optional[str] = None,
+    ) -> None:
+        """Set AC level and impedance mode in one write.
+
+        Args:
+            voltage: AC voltage level in Volts.
+            current: AC current level in Amps.
+            mode: impedance measurement function, see :attr:`impedance_mode`.
+
+        Raises:
+            ValueError: if a value is outside the valid range or set of the
+                corresponding control.
+        """
+        commands: List[str] = []
+        if voltage is not None:
+            voltage = strict_range(voltage, self._ac_voltage_values)
+            commands.append(f"VOLT:LEV {voltage:g}")
+        if current is not None:
+            current = strict_range(current, self._ac_current_values)
+            commands.append(f"CURR:LEV {current:g}")
+        if mode is not None:
+            mode = strict_discrete_set(mode, agilent4284A.IMPEDANCE_MODES)
+            commands.append(f"FUNC:IMP {mode}")
+        if commands:
+            self.write(";:".join(commands))
+
+    def iter_sweep_measurement(
+        self, sweep_mode: str, sweep_values: Sequence[float]
+    ) -> Iterator[Tuple[List[float], List[float], List[float]]]:
+        """Run list sweep measurement, yielding each block of points as it completes.
+
+        The 4284A sweeps at most 10 points per list, so results are available one
+        block at a time. Otherwise equivalent to :meth:`sweep_measurement`.
+
+        Args:
+            sweep_mode: parameter to sweep across. Must be one of `frequency`,
+                `voltage`, `current`, `bias_voltage`, or `bias_current`.
+            sweep_values: parameter values to sweep across.
+
+        Yields:
+            values as configured with :attr:`impedance_mode` and corresponding sweep
+            parameters for each block, in format ([val A], [val B], [sweep_values]).
+
+        Raises:
+            KeyError: if `sweep_mode` is not supported.
+        """
+        param_dict = {
+            "frequency": ("FREQ", (20, 1e6)),
+            "voltage": ("VOLT", self._ac_voltage_values),
+            "current": ("CURR", self._ac_current_values),
+            "bias_voltage": ("BIAS:VOLT", self._bias_voltage_values),
+            "bias_current": ("BIAS:CURR", self._bias_current_values),
+        }
+        if sweep_mode not in param_dict:
+            raise KeyError(
+                f"Sweep mode must be one of {list(param_dict)}, not '{sweep_mode}'."
+            )
+        command, (low_limit, high_limit) = param_dict[sweep_mode]
+        if min(sweep_values) < low_limit or max(sweep_values) > high_limit:
+            log.warning(
+                "%s values are outside valid Agilent 4284A range of %g and %g "
+                "and will be truncated.",
+                sweep_mode,
+                low_limit,
+                high_limit,
+            )
+            sweep_values = [v for v in sweep_values if low_limit <= v <= high_limit]
+
+        self.clear()
+        self.write(
+            "TRIG:SOUR BUS;:DISP:PAGE LIST;:FORM ASC;:LIST:MODE SEQ;:INIT:CONT ON"
+        )
+        try:
+            for i in range(0, len(sweep_values), 10):
+                block = sweep_values[i : i + 10]
+                param_str = ",".join(f"{p:g}" for p in block)
+                self.write(f"LIST:{command} {param_str};:TRIG:IMM")
+                while (int(self.ask("STAT:OPER?")) & 8) != 8:  # Sweep bit no. 3
+                    sleep(0.1)
+                # Read measurements and swept values in one compound query
+                reply = self.ask(f"FETCH?;:LIST:{command}?")
+                measured_str, swept_str = reply.split(";")
+                measured = [float(v) for v in measured_str.split(",")]
+                # 4-ples of numbers, first two are data A and B
+                yield (
+                    measured[0 : 4 * len(block) : 4],
+                    measured[1 : 4 * len(block) : 4],
+                    [float(v) for v in swept_str.split(",")],
+                )
+        finally:
+            # Return to manual trigger and reset display
+            self.write(":TRIG:SOUR HOLD;:DISP:PAGE MEAS")
+        self.check_errors()
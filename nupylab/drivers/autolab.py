@@ -45,6 +45,9 @@ class Autolab:
             be explicitly mentioned in every single method.
     """
 
+    # Highest current range, as power of ten in Amps
+    MAX_CURRENT_RANGE = 0
+
     def __init__(
             self,
             hardware_file: str,
@@ -63,6 +66,7 @@ class Autolab:
         sdk = os.path.join(sdk_path, "EcoChemie.Autolab.Sdk")
         self._adx = os.path.join(sdk_path, "Hardware Setup Files/Adk.x")
         self.pcd = None
+        self._connected = False
         if clr.FindAssembly(sdk):
             clr.AddReference(sdk)
             from EcoChemie.Autolab.Sdk import Instrument
@@ -75,6 +79,7 @@ class Autolab:
     def disconnect(self) -> None:
         """Disconnect from Autolab."""
         self._instrument.Disconnect()
+        self._connected = False
 
     @property
     def is_measuring(self) -> bool:
@@ -92,7 +97,8 @@ class Autolab:
         Hardware configuration file is set by instrument model and FRA option.
 
         Args:
-            fra_module: FRA module to connect to, if installed, e.g. `FRA2`.
+            hardware_file: the hardware configuration file for the instrument, see
+                class note.
 
         Returns:
             bool indicating whether Autolab is connected.
@@ -100,7 +106,8 @@ class Autolab:
         self._instrument.AutolabConnection.EmbeddedExeFileToStart = self._adx
         self._instrument.set_HardwareSetupFile(hardware_file)
         self._instrument.Connect()
-        return self._instrument.AutolabConnection.IsConnected
+        self._connected = self._instrument.AutolabConnection.IsConnected
+        return self._connected
 
     def measure(self, procedure):
         """Load and run measurement procedure.
@@ -108,12 +115,10 @@ class Autolab:
         Args:
             procedure: Nova procedure file of .nox type
         """
-        self.pcd = self._instrument.LoadProcedure(procedure)
-
-        if self._instrument.AutolabConnection.IsConnected:
-            self.pcd.Measure()
-        else:
+        if not self._connected:
             raise AutolabException("Autolab is not connected", -2000)
+        self.pcd = self._instrument.LoadProcedure(procedure)
+        self.pcd.Measure()
 
     def save(self) -> None:
         """Save procedure as current filename with date and time appended."""
@@ -126,8 +131,19 @@ class Autolab:
 
     def setCellOn(self,On=True):
         self._instrument.Ei.set_CellOnOff(On)
-        while self._instrument.Ei.get_CurrentOverload() :
-            self._instrument.Ei.set_CurrentRange(self._instrument.Ei.CurrentRange + 1)
+        self._clear_current_overload()
+
+    def _clear_current_overload(self) -> None:
+        """Step up current range until overload clears or highest range is reached.
+
+        An overloaded current reading is clipped, so the required range cannot be
+        computed from it directly.
+        """
+        ei = self._instrument.Ei
+        current_range = ei.CurrentRange
+        while current_range < self.MAX_CURRENT_RANGE and ei.get_CurrentOverload():
+            current_range += 1
+            ei.set_CurrentRange(current_range)
 
     def set_mode(self, mode: str = 'potentiostatic') -> None:
         if mode.casefold() == 'galvanostatic':
@@ -141,8 +157,7 @@ class Autolab:
     def set_potential(self, potential: float) -> float:
         self.set_mode('potentiostatic')
         self._instrument.Ei.set_Setpoint(potential)
-        if self._instrument.Ei.get_CurrentOverload() :
-            self._instrument.Ei.set_CurrentRange(self._instrument.Ei.Current + 1)
+        self._clear_current_overload()
 
         return self._instrument.Ei.PotentialApplied
 
@@ -155,7 +170,8 @@ class Autolab:
         Returns:
             Autolab current range.
         """
-        self._instrument.Ei.set_CurrentRange(floor(log10(current)))
+        current_range = floor(log10(max(abs(current), 1e-12)))
+        self._instrument.Ei.set_CurrentRange(min(current_range, self.MAX_CURRENT_RANGE))
         return self._instrument.Ei.CurrentRange
 
     def loadData(self, filename):
@@ -172,12 +188,16 @@ class Autolab:
 #                sigPotential = np.array(sig.get_Item('EI_0.CalcPotential').ValueAsObject)
 #                sigPotAppl   = np.array(sig.get_Item('SetpointApplied').ValueAsObject)
 #
-                Data = np.array([
-                    sig.get_Item('SetpointApplied').ValueAsObject,
-                    sig.get_Item('EI_0.CalcCurrent').ValueAsObject,
-                    sig.get_Item('CalcTime').ValueAsObject,
-                    sig.get_Item('ScanNumber').ValueAsObject
-                    ]).T
+                getItem = sig.get_Item
+                # Convert each signal to a typed column directly, avoiding an object
+                # array and transpose copy
+                Data = np.column_stack([
+                    np.asarray(getItem(name).ValueAsObject, dtype=np.float64)
+                    for name in ('SetpointApplied',
+                                 'EI_0.CalcCurrent',
+                                 'CalcTime',
+                                 'ScanNumber')
+                    ])
 
                 # CMDLOG(self.CMD,"The File Format is %s \n"%
                 #             ' '.join(['SetpointApplied',
@@ -192,13 +212,16 @@ class Autolab:
                 cmd1 = pcd.Commands['PlotsNyquist']
                 cmd2 = pcd.Commands['PlotsBodeModulus']
 
-                Data = np.array([
-                    cmd1.CommandParameters['Z'].ValueAsObject,  # Freq
-                    cmd1.CommandParameters['X'].ValueAsObject,  # Zr
-                    cmd1.CommandParameters['Y'].ValueAsObject,  # Zi
-                    cmd2.CommandParameters['Y'].ValueAsObject,  # ZMod
-                    cmd2.CommandParameters['Z'].ValueAsObject  # -Phase
-                    ]).T
+                params1 = cmd1.CommandParameters
+                params2 = cmd2.CommandParameters
+                Data = np.column_stack([
+                    np.asarray(param.ValueAsObject, dtype=np.float64)
+                    for param in (params1['Z'],  # Freq
+                                  params1['X'],  # Zr
+                                  params1['Y'],  # Zi
+                                  params2['Y'],  # ZMod
+                                  params2['Z'])  # -Phase
+                    ])
 
                 # CMDLOG(self.CMD,"The File Format is %s \n"%
                 #             ' '.join(['Frequency',
@@ -58,11 +58,14 @@ import inspect
 import os
 import sys
 from collections import namedtuple
+from functools import lru_cache
 from ctypes import (
     POINTER,
     Structure,
     byref,
+    c_bool,
     c_char,
+    c_char_p,
     c_double,
     c_float,
     c_int32,
@@ -70,8 +73,22 @@ from ctypes import (
     c_uint8,
     cast,
     create_string_buffer,
+    memset,
+    pointer,
+    sizeof,
+)
+from typing import (
+    Any,
+    Dict,
+    Hashable,
+    List,
+    Optional,
+    Sequence,
+    TYPE_CHECKING,
+    Tuple,
+    Type,
+    Union,
 )
-from typing import Any, Dict, List, Optional, Sequence, TYPE_CHECKING, Type, Union
 
 import_err = None
 try:
@@ -93,6 +110,14 @@ try:
 except ImportError:
     GOT_NUMPY = False
 
+# Numba is optional, it compiles the time conversion used when parsing data
+try:
+    from numba import njit
+
+    GOT_NUMBA = True
+except ImportError:
+    GOT_NUMBA = False
+
 if TYPE_CHECKING:
     from ctypes import Array
 
@@ -163,7 +188,7 @@ class BiologicPotentiostat:
         Raises:
             WindowsError: If the EClib DLL cannot be found
         """
-        model = "KBIO_DEV_" + model.replace("-", "").replace(" ", "").upper()
+        model = "KBIO_DEV_" + model.translate(_MODEL_TRANS).upper()
         self.model = model
         if model in SP300SERIES:
             self.series = "sp300"
@@ -176,6 +201,20 @@ class BiologicPotentiostat:
         self.address = address
         self._id: Optional[c_int32] = None
         self._device_info: Optional[DeviceInfos] = None
+        # Reused by the polling methods, the results are converted without keeping
+        # references to the buffers
+        self._c_databuffer = (c_uint32 * 1000)()
+        self._c_data_infos = DataInfos()
+        self._p_data_infos = pointer(self._c_data_infos)
+        self._c_current_values = CurrentValues()
+        self._p_current_values = pointer(self._c_current_values)
+        self._c_channel_infos = ChannelInfos()
+        self._p_channel_infos = pointer(self._c_channel_infos)
+        # Shared by the methods returning strings from the DLL. Their results are read
+        # with .value, a C-level copy up to the NUL that is bounded by the buffer size,
+        # unlike string_at
+        self._c_message = create_string_buffer(4096)
+        self._c_message_size = c_uint32()
 
         # Load the EClib dll
         if eclib_path is None:
@@ -189,8 +228,8 @@ class BiologicPotentiostat:
             eclib_dll_path = eclib_path + "EClib.dll"
             blfind_dll_path = eclib_path + "blfind64.dll"
 
-        self._eclib = WinDLL(eclib_dll_path)
-        self._blfind = WinDLL(blfind_dll_path)
+        self._eclib = _load_eclib(eclib_dll_path)
+        self._blfind = _load_blfind(blfind_dll_path)
 
     @property
     def id_number(self) -> Optional[int]:
@@ -223,11 +262,10 @@ class BiologicPotentiostat:
         Returns:
             The version string for the library.
         """
-        size = c_uint32(256)
-        version = create_string_buffer(256)
-        ret = self._eclib.BL_GetLibVersion(byref(version), byref(size))
+        self._c_message_size.value = sizeof(self._c_message)
+        ret = self._eclib.BL_GetLibVersion(self._c_message, byref(self._c_message_size))
         self.check_eclib_return_code(ret)
-        return version.value
+        return self._c_message.value
 
     def get_error_message(self, error_code: int) -> bytes:
         """Return the error message corresponding to error_code.
@@ -241,10 +279,9 @@ class BiologicPotentiostat:
         Raises:
             ECLibError if error message could not be retrieved.
         """
-        message = create_string_buffer(256)
-        number_of_chars = c_uint32(256)
+        self._c_message_size.value = sizeof(self._c_message)
         ret = self._eclib.BL_GetErrorMsg(
-            error_code, byref(message), byref(number_of_chars)
+            error_code, self._c_message, byref(self._c_message_size)
         )
         # IMPORTANT: we cannot use self.check_eclib_return_code here, since that
         # internally use this method, thus we have the potential for an infinite loop
@@ -257,7 +294,7 @@ class BiologicPotentiostat:
                 "of the error code."
             )
             raise ECLibError(err_msg, ret)
-        return message.value
+        return self._c_message.value
 
     ############################
     # Communications functions #
@@ -303,7 +340,8 @@ class BiologicPotentiostat:
     def test_connection(self) -> None:
         """Test the connection."""
         ret = self._eclib.BL_TestConnection(self._id)
-        self.check_eclib_return_code(ret)
+        if ret:
+            self.check_eclib_return_code(ret)
 
     ######################
     # Firmware functions #
@@ -328,17 +366,12 @@ class BiologicPotentiostat:
             message can be retrieved with the get_error_message method.
         """
         c_results = (c_int32 * len(channels))()
-        p_results = cast(c_results, POINTER(c_int32))
-
-        c_channels = (c_uint8 * len(channels))()
-        for i, channel in enumerate(channels):
-            c_channels[i] = channel
-        p_channels = cast(c_channels, POINTER(c_uint8))
+        c_channels = _c_channel_array(channels)
 
         ret = self._eclib.BL_LoadFirmware(
             self._id,
-            p_channels,
-            p_results,
+            c_channels,
+            c_results,
             len(channels),
             False,
             force_reload,
@@ -346,7 +379,7 @@ class BiologicPotentiostat:
             None,
         )
         self.check_eclib_return_code(ret)
-        return list(c_results)
+        return _c_results_list(c_results)
 
     #################################
     # Channel information functions #
@@ -371,8 +404,7 @@ class BiologicPotentiostat:
             A list of channel plugged statuses as booleans.
         """
         status = (c_uint8 * 16)()
-        pstatus = cast(status, POINTER(c_uint8))
-        ret = self._eclib.BL_GetChannelsPlugged(self._id, pstatus, 16)
+        ret = self._eclib.BL_GetChannelsPlugged(self._id, status, 16)
         self.check_eclib_return_code(ret)
         return [result == 1 for result in status]
 
@@ -390,26 +422,37 @@ class BiologicPotentiostat:
             can be converted from an integer code to a string. The keys for those values
             are suffixed by (translated).
         """
-        channel_info = ChannelInfos()
-        self._eclib.BL_GetChannelInfos(self._id, channel, byref(channel_info))
-        out = structure_to_dict(channel_info)
+        self._eclib.BL_GetChannelInfos(self._id, channel, self._p_channel_infos)
+        out = structure_to_dict(self._c_channel_infos)
 
         # Translate code to strings
-        out["FirmwareCode(translated)"] = FIRMWARE_CODES[out["FirmwareCode"]]
-        out["AmpCode(translated)"] = AMP_CODES.get(out["AmpCode"])
-        out["State(translated)"] = STATES.get(out["State"])
-        out["MaxIRange(translated)"] = I_RANGES.get(out["MaxIRange"])
-        out["MinIRange(translated)"] = I_RANGES.get(out["MinIRange"])
-        out["MaxBandwidth"] = BANDWIDTHS.get(out["MaxBandwidth"])
+        for key, out_key, codes, strict in _CHANNEL_INFO_TRANSLATIONS:
+            out[out_key] = codes[out[key]] if strict else codes.get(out[key])
         return out
 
+    def get_channel_state(self, channel: int) -> int:
+        """Get state code of the specified channel.
+
+        Equivalent to the `State` item of :meth:`get_channel_infos`, without building
+        the full dict.
+
+        Args:
+            channel: Selected channel, zero based (0-15 on most devices).
+
+        Returns:
+            Channel state code, see :data:`STATES`.
+        """
+        self._eclib.BL_GetChannelInfos(self._id, channel, self._p_channel_infos)
+        return self._c_channel_infos.State
+
     def get_message(self, channel: int) -> bytes:
         """Return a message from the firmware of a channel."""
-        size = c_uint32(4096)
-        message = create_string_buffer(4096)
-        ret = self._eclib.BL_GetMessage(self._id, channel, byref(message), byref(size))
+        self._c_message_size.value = sizeof(self._c_message)
+        ret = self._eclib.BL_GetMessage(
+            self._id, channel, self._c_message, byref(self._c_message_size)
+        )
         self.check_eclib_return_code(ret)
-        return message.value
+        return self._c_message.value
 
     #######################
     # Technique functions #
@@ -435,6 +478,64 @@ class BiologicPotentiostat:
         Raises:
             ECLibError: On errors from the EClib communications library.
         """
+        c_technique_file, c_tecc_params, _c_params = self._technique_args(technique)
+        ret = self._eclib.BL_LoadTechnique(
+            self._id,
+            channel,
+            c_technique_file,
+            c_tecc_params,
+            first,
+            last,
+            display,
+        )
+        self.check_eclib_return_code(ret)
+
+    def load_technique_channels(
+        self,
+        channels: Sequence[int],
+        technique: Technique,
+        first: bool = True,
+        last: bool = True,
+        display: bool = False,
+    ) -> None:
+        """Load a technique on the selected channels.
+
+        Technique arguments are converted once and reused for every channel.
+
+        Args:
+            channels: Sequence with 1 integer per channel (usually 16) that
+                indicates whether the technique will be loaded (0=False and 1=True).
+            technique: the technique to load.
+            first: whether this technique is the first technique.
+            last: whether this technique is the last technique.
+            display: whether to display the loading progress.
+
+        Raises:
+            ECLibError: On errors from the EClib communications library.
+        """
+        c_technique_file, c_tecc_params, _c_params = self._technique_args(technique)
+        for channel, selected in enumerate(channels):
+            if not selected:
+                continue
+            ret = self._eclib.BL_LoadTechnique(
+                self._id,
+                channel,
+                c_technique_file,
+                c_tecc_params,
+                first,
+                last,
+                display,
+            )
+            self.check_eclib_return_code(ret)
+
+    def _technique_args(
+        self, technique: Technique
+    ) -> Tuple[bytes, TECCParams, Array[TECCParam]]:
+        """Convert technique to technique filename and EClib parameter structs.
+
+        The parameter array is returned along with the TECCParams struct pointing to
+        it, so that it is kept alive for the duration of the EClib calls.
+        """
         c_technique_file: bytes
         if self.series == "sp300":
             filename, ext = os.path.splitext(technique.technique_filename)
@@ -450,17 +551,7 @@ class BiologicPotentiostat:
         c_tecc_params.len = len(c_params)
         p_params = cast(c_params, POINTER(TECCParam))
         c_tecc_params.pParams = p_params
-
-        ret = self._eclib.BL_LoadTechnique(
-            self._id,
-            channel,
-            c_technique_file,
-            c_tecc_params,
-            first,
-            last,
-            display,
-        )
-        self.check_eclib_return_code(ret)
+        return c_technique_file, c_tecc_params, c_params
 
     def define_bool_parameter(
         self, label: str, value: bool, index: int, tecc_param: TECCParam
@@ -550,17 +641,12 @@ class BiologicPotentiostat:
             retrieved with the get_error_message method.
         """
         c_results = (c_int32 * len(channels))()
-        p_results = cast(c_results, POINTER(c_int32))
-
-        c_channels = (c_uint8 * len(channels))()
-        for i, channel in enumerate(channels):
-            c_channels[i] = channel
-        p_channels = cast(c_channels, POINTER(c_uint8))
+        c_channels = _c_channel_array(channels)
         ret = self._eclib.BL_StartChannels(
-            self._id, p_channels, p_results, len(channels)
+            self._id, c_channels, c_results, len(channels)
         )
         self.check_eclib_return_code(ret)
-        return list(c_results)
+        return _c_results_list(c_results)
 
     def stop_channel(self, channel: int) -> None:
         """Stop the channel.
@@ -586,17 +672,12 @@ class BiologicPotentiostat:
             retrieved with the get_error_message method.
         """
         c_results = (c_int32 * len(channels))()
-        p_results = cast(c_results, POINTER(c_int32))
-
-        c_channels = (c_uint8 * len(channels))()
-        for i, channel in enumerate(channels):
-            c_channels[i] = channel
-        p_channels = cast(c_channels, POINTER(c_uint8))
+        c_channels = _c_channel_array(channels)
         ret = self._eclib.BL_StopChannels(
-            self._id, p_channels, p_results, len(channels)
+            self._id, c_channels, c_results, len(channels)
         )
         self.check_eclib_return_code(ret)
-        return list(c_results)
+        return _c_results_list(c_results)
 
     ##################
     # Data functions #
@@ -611,12 +692,12 @@ class BiologicPotentiostat:
         Returns:
             A dict of current values information.
         """
-        current_values = CurrentValues()
-        ret = self._eclib.BL_GetCurrentValues(self._id, channel, byref(current_values))
-        self.check_eclib_return_code(ret)
+        ret = self._eclib.BL_GetCurrentValues(self._id, channel, self._p_current_values)
+        if ret:
+            self.check_eclib_return_code(ret)
 
         # Convert the struct to a dict and translate a few values
-        out = structure_to_dict(current_values)
+        out = structure_to_dict(self._c_current_values)
         out["State(translated)"] = STATES[out["State"]]
         out["IRange(translated)"] = I_RANGES[out["IRange"]]
         return out
@@ -630,28 +711,42 @@ class BiologicPotentiostat:
         Returns:
             A :class:`.KBIOData` object or None if no data was available.
         """
-        # Raw data is retrieved in an array of integers
-        c_databuffer = (c_uint32 * 1000)()
-        p_data_buffer = cast(c_databuffer, POINTER(c_uint32))
-        c_data_infos = DataInfos()
-        c_current_values = CurrentValues()
-
+        # Buffer is reused, clear it so unused entries are blank after the call
+        memset(self._c_databuffer, 0, sizeof(self._c_databuffer))
         ret = self._eclib.BL_GetData(
             self._id,
             channel,
-            p_data_buffer,
-            byref(c_data_infos),
-            byref(c_current_values),
+            self._c_databuffer,
+            self._p_data_infos,
+            self._p_current_values,
         )
-        self.check_eclib_return_code(ret)
+        if ret:
+            self.check_eclib_return_code(ret)
 
         # The KBIOData will ask the appropriate techniques for which data
         # fields they return data in
-        data: KBIOData = KBIOData(c_databuffer, c_data_infos, c_current_values, self)
+        data: KBIOData = KBIOData(
+            self._c_databuffer, self._c_data_infos, self._c_current_values, self
+        )
         if data.technique == "KBIO_TECHID_NONE":
             return None
         return data
 
+    def get_data_multi(self, channels: Sequence[int]) -> List[Optional[KBIOData]]:
+        """Get data for each of the specified channels.
+
+        Args:
+            channels: The numbers of the channels (zero based).
+
+        Returns:
+            A :class:`.KBIOData` object, or None if no data was available, for each
+            channel in `channels`.
+        """
+        # All channels share the preallocated buffers, each KBIOData is parsed before
+        # the next channel is read
+        get_data = self.get_data
+        return [get_data(channel) for channel in channels]
+
     def convert_numeric_into_single(self, numeric: int) -> float:
         """Convert a numeric (integer) into a float.
 
@@ -660,9 +755,8 @@ class BiologicPotentiostat:
         corresponds to the float that it should describe. This function is used to
         convert the integer back to the corresponding float.
 
-        NOTE: This trick can also be performed with ctypes along the lines of:
-        ``c_float.from_buffer(c_uint32(numeric))``, but in this driver the library
-        version is used.
+        NOTE: The conversion is a plain bit reinterpretation, so it is done with ctypes
+        instead of a ``BL_ConvertNumericIntoSingle`` library call.
 
         Args:
             numeric: The integer that represents a float.
@@ -670,10 +764,7 @@ class BiologicPotentiostat:
         Returns:
             The float value.
         """
-        c_out_float = c_float()
-        ret = self._eclib.BL_ConvertNumericIntoSingle(numeric, byref(c_out_float))
-        self.check_eclib_return_code(ret)
-        return c_out_float.value
+        return c_float.from_buffer(c_uint32(numeric)).value
 
     def check_eclib_return_code(self, error_code: int) -> None:
         """Check a ECLib return code and raise the appropriate exception."""
@@ -698,7 +789,7 @@ class BiologicPotentiostat:
         number_of_chars = c_uint32(8192)
         nb_devices = c_uint32()
         ret = self._blfind.BL_FindEChemDev(
-            byref(serialized), byref(number_of_chars), byref(nb_devices)
+            serialized, byref(number_of_chars), byref(nb_devices)
         )
         self.check_blfind_return_code(ret)
         devices = self._parse_device_serialization(
@@ -718,7 +809,7 @@ class BiologicPotentiostat:
         number_of_chars = c_uint32(4096)
         nb_devices = c_uint32()
         ret = self._blfind.BL_FindEChemEthDev(
-            byref(serialized), byref(number_of_chars), byref(nb_devices)
+            serialized, byref(number_of_chars), byref(nb_devices)
         )
         self.check_blfind_return_code(ret)
         devices = self._parse_device_serialization(
@@ -738,7 +829,7 @@ class BiologicPotentiostat:
         number_of_chars = c_uint32(4096)
         nb_devices = c_uint32()
         ret = self._blfind.BL_FindEChemUsbDev(
-            byref(serialized), byref(number_of_chars), byref(nb_devices)
+            serialized, byref(number_of_chars), byref(nb_devices)
         )
         self.check_blfind_return_code(ret)
         devices = self._parse_device_serialization(
@@ -770,7 +861,9 @@ class BiologicPotentiostat:
             new_config += f"NM%{netmask}$"
         if gateway:
             new_config += f"GW%{gateway}$"
-        ret = self._blfind.BL_SetConfig(target_ip, new_config)
+        ret = self._blfind.BL_SetConfig(
+            target_ip.encode("utf-8"), new_config.encode("utf-8")
+        )
         self.check_blfind_return_code(ret)
 
     def get_blfind_error_message(self, error_code: int) -> bytes:
@@ -787,9 +880,7 @@ class BiologicPotentiostat:
         """
         message = create_string_buffer(256)
         number_of_chars = c_uint32(256)
-        ret = self._blfind.BL_GetErrorMsg(
-            error_code, byref(message), byref(number_of_chars)
-        )
+        ret = self._blfind.BL_GetErrorMsg(error_code, message, byref(number_of_chars))
         # IMPORTANT: we cannot use self.check_eclib_return_code here, since that
         # internally use this method, thus we have the potential for an infinite loop
         if ret < 0:
@@ -902,6 +993,10 @@ class KBIOData:
 
     * kbio_data.Ewe_numpy
     * kbio_data.I_numpy
+
+    With numpy installed the data is stored as one array per field, and the lists are
+    generated on first access. The arrays are float64 for float fields and time, and
+    int64 for integer fields, like arrays made from the lists.
     """
 
     def __init__(
@@ -942,178 +1037,197 @@ class KBIOData:
         self.process = c_data_infos.ProcessIndex
         # Init the data_fields
         self.data_fields: List[DataField] = self._init_data_fields(instrument)
+        self._data_columns = _resolve_data_columns(
+            self.technique, self.process, instrument.series
+        )
+        self._data_field_names = _resolve_data_field_names(
+            self.technique, self.process, instrument.series
+        )
 
         # Extract the number of points and columns
         self.number_of_points = c_data_infos.NbRows
         self.number_of_columns = c_data_infos.NbCols
         self.starttime = c_data_infos.StartTime
 
-        # Make lists for the data in properties named after the field_names
-        for data_field in self.data_fields:
-            setattr(self, data_field.name, [])
-
-        # Process data fields either have `t`  or `t_high` and `t_low`
-        if not hasattr(self, "t"):
-            self.time: List[float] = []  # TODO: add time to data fields
-
         # Parse the data
-        self._parse_data(c_databuffer, c_current_values.TimeBase, instrument)
+        if GOT_NUMPY:
+            self._parse_data_numpy(
+                c_databuffer, c_current_values.TimeBase, instrument.series
+            )
+            return
+
+        self._parse_data(c_databuffer, c_current_values.TimeBase)
 
     def _init_data_fields(self, instrument: BiologicPotentiostat) -> List[DataField]:
         """Initialize the data fields property."""
-        # Get the data_fields class variable from the corresponding technique class
-        if self.technique not in TECHNIQUE_IDENTIFIERS_TO_CLASS:
-            message = (
-                f"The technique '{self.technique}' has no entry in "
-                f"TECHNIQUE_IDENTIFIERS_TO_CLASS. The is required to be able to "
-                f"interpret the data."
-            )
+        return _resolve_data_fields(self.technique, self.process, instrument.series)
 
-            raise ECLibCustomException(message, -20000)
-        technique_class: Type[Technique]
-        technique_class = TECHNIQUE_IDENTIFIERS_TO_CLASS[self.technique]
+    def _parse_data(self, c_databuffer: Array[c_uint32], timebase: int) -> None:
+        """Parse the data into one list per field, in properties named after the fields.
 
-        if "data_fields" not in technique_class.__dict__:
-            message = (
-                f"The technique class {technique_class.__name__} does not "
-                f"define a 'data_fields' class variable, which is required "
-                f"for data interpretation."
-            )
-            raise ECLibCustomException(message, -20001)
+        Each field is a column of the data buffer, read with a single strided slice
+        instead of value by value. Floats are read through a :py:class:`ctypes.c_float`
+        view of the same memory, which is the conversion performed by
+        :meth:`BiologicPotentiostat.convert_numeric_into_single`.
 
-        data_fields_complete: Dict[str, List[DataField]]
-        data_fields_complete = technique_class.data_fields[self.process]
-        data_fields_out: List[DataField]
-
-        try:
-            data_fields_out = data_fields_complete["common"]
-        except KeyError:
-            try:
-                data_fields_out = data_fields_complete[instrument.series]
-            except KeyError as exc:
-                message = (
-                    f"Unable to get data_fields from technique class. The "
-                    f"data_fields class variable in the technique class must "
-                    f"have either a 'common' or a '{instrument.series}' "
-                    f"key."
+        Args:
+            c_databuffer: ctypes array of :py:class:`ctypes.c_uint32` used as the data
+                buffer.
+            timebase: The timebase for the time calculation in microseconds.
+        """
+        number_of_columns = self.number_of_columns
+        size = self.number_of_points * number_of_columns
+        if size == 0:
+            # An empty read may also report no columns, which is not a valid slice step
+            if "t" not in self._data_field_names:
+                self.time = []
+            for _, data_field in self._data_columns:
+                setattr(self, data_field.name, [])
+            assert not any(c_databuffer)
+            return
+        floats = (c_float * size).from_buffer(c_databuffer)
+
+        # Process data fields either have `t`  or `t_high` and `t_low`. If there is no
+        # `t`, the first two columns are the high and low words of the time
+        if "t" not in self._data_field_names:
+            # Python ints are arbitrary precision, so the shift is exact
+            self.time: List[float] = [
+                self.starttime + timebase * ((t_high << 32) | t_low)
+                for t_high, t_low in zip(
+                    c_databuffer[0:size:number_of_columns],
+                    c_databuffer[1:size:number_of_columns],
                 )
-                raise ECLibCustomException(message, -20002) from exc
+            ]  # TODO: add time to data fields
 
-        return data_fields_out
+        for column, data_field in self._data_columns:
+            source = floats if data_field.type is c_float else c_databuffer
+            setattr(self, data_field.name, source[column:size:number_of_columns])
 
-    def _parse_data(
-        self,
-        c_databuffer: Array[c_uint32],
-        timebase: int,
-        instrument: BiologicPotentiostat,
+        # Check that the rest of the buffer is blank. A single assert statement, so
+        # that the check is skipped entirely when running with -O
+        assert not any(c_databuffer[size:])
+
+    def _parse_data_numpy(
+        self, c_databuffer: Array[c_uint32], timebase: int, series: str
     ) -> None:
-        """Parse the data and write to c_databuffer.
+        """Parse the data with vectorized NumPy operations into one array per field.
+
+        Equivalent to the pure Python parsing in :meth:`_parse_data`. Floats are
+        reinterpreted from their uint32 bit patterns, which is the conversion performed
+        by :meth:`BiologicPotentiostat.convert_numeric_into_single`. The points are
+        viewed as a structured array, and each field is copied out of the reused driver
+        buffer as float64 or int64, which hold the values exactly.
 
         Args:
             c_databuffer: ctypes array of :py:class:`ctypes.c_uint32` used as the data
                 buffer.
             timebase: The timebase for the time calculation in microseconds.
-            instrument: Instrument instance of :class:`.BiologicPotentiostat`.
+            series: Instrument series, 'sp300' or 'vmp3'.
         """
-        # The data is written as one long array of points with a certain
-        # amount of colums. Get the index of the first item of each point by
-        # getting the range from 0 til n_point * n_columns in jumps of
-        # n_columns
-        for index in range(
-            0, self.number_of_points * self.number_of_columns, self.number_of_columns
-        ):
-            # If there is a special time variable
-            if hasattr(self, "time"):
-                # Calculate the time
-                t_high = c_databuffer[index]
-                t_low = c_databuffer[index + 1]
-                # NOTE: The documentation uses a bitshift operation for the:
-                # ((t_high * 2 ** 32) + tlow) operation as
-                # ((thigh << 32) + tlow), but I could not be bothered to
-                # figure out exactly how a bitshift operation is defined for
-                # an int class that can change internal representation, so I
-                # just do the explicit multiplication
-                self.time.append(self.starttime + timebase * ((t_high * 2**32) + t_low))
-                # Only offset reading the rest of the variables if there is a
-                # special conversion time variable
-                time_variable_offset = 2
-            else:
-                time_variable_offset = 0
-
-            # Get remaining fields as defined in data fields
-            value: Union[int, float]
-            for field_number, data_field in enumerate(self.data_fields):
-                value = c_databuffer[index + time_variable_offset + field_number]
-                # If the type is supposed to be a float, convert the numeric to
-                # float using the convenience function
-                if data_field.type is c_float:
-                    value = instrument.convert_numeric_into_single(value)
+        size = self.number_of_points * self.number_of_columns
+        buffer = np.frombuffer(c_databuffer, dtype=np.uint32)
+
+        arrays: Dict[str, np.ndarray] = {}
+        if size == 0:
+            # An empty read may also report no columns, which leaves no point layout
+            # to build the record dtype from
+            if "t" not in self._data_field_names:
+                arrays["time"] = np.empty(0)
+            for _, data_field in self._data_columns:
+                arrays[data_field.name] = np.empty(
+                    0, dtype=_FIELD_NUMPY_DTYPES[data_field.type]
+                )
+            self._arrays = arrays
+            assert not buffer.any()
+            return
 
-                # Append the field value to the appropriate list in a property
-                getattr(self, data_field.name).append(value)
+        raw = buffer[:size].reshape(self.number_of_points, self.number_of_columns)
+        # Process data fields either have `t`  or `t_high` and `t_low`
+        if "t" not in self._data_field_names:
+            time = np.empty(self.number_of_points)
+            _parse_time(raw, self.starttime, timebase, time)
+            arrays["time"] = time
+
+        # The record dtype reinterprets the columns of a point, skipping time words
+        record_dtype = _resolve_record_dtype(
+            self.technique, self.process, series, self.number_of_columns
+        )
+        records = np.frombuffer(
+            c_databuffer, dtype=record_dtype, count=self.number_of_points
+        )
+        # Widening copies the fields out of the buffer, which is reused by the driver
+        for _, data_field in self._data_columns:
+            arrays[data_field.name] = records[data_field.name].astype(
+                _FIELD_NUMPY_DTYPES[data_field.type]
+            )
+        self._arrays = arrays
 
         # Check that the rest of the buffer is blank
-        for index in range(self.number_of_points * self.number_of_columns, 1000):
-            assert c_databuffer[index] == 0
+        assert not buffer[size:].any()
 
-    def __getattr__(self, key: str) -> np.ndarray:
-        """Return generated numpy arrays for the data instead of lists, if requested.
+    def get_numpy(self, field_name: str) -> np.ndarray:
+        """Return the data of a field as numpy array, without copying.
 
-        Requested property must be in the form field_name + '_numpy'.
+        Equivalent to the field_name + '_numpy' attribute, without going through
+        :meth:`__getattr__`.
 
         Args:
-            key: data field to return as numpy array.
+            field_name: data field name, e.g. 'Ewe', or 'time'.
 
         Returns:
-            numpy array of requested data field.
+            numpy array of requested data field, float64 for float fields and time, and
+            int64 for integer fields.
 
         Raises:
             RuntimeError: Unable to import numpy.
-            ValueError: Unable to infer appropriate numpy dtype for data.
-            AttributeError: Key is not in data_fields.
+            KeyError: field_name is not a data field.
         """
-        # __getattr__ is only called after the check of whether the key is in the
-        # instance dict, therefore it is ok to raise attribute error at this point if
-        # the key does not have the special form we expect
-        if not key.endswith("_numpy"):
-            message = f"{self.__class__} object has no attribute {key}"
-            raise AttributeError(message)
-
         if not GOT_NUMPY:
             message = "The numpy module is required to get the data " "as numpy arrays."
             raise RuntimeError(message)
+        return self._arrays[field_name]
 
-        # Get the requested field name e.g. Ewe
-        requested_field = key.split("_numpy")[0]
-
-        dtype: Any = None
-        if requested_field == "time":
-            dtype = float
-        if requested_field in self.data_field_names:
-            # Determine the numpy type to convert to
-            for field in self.data_fields:
-                if field.name == requested_field:
-                    correct_field = field
-                    break
-            if correct_field.type is c_float:
-                dtype = float
-            elif correct_field.type is c_uint32:
-                dtype = int
-
-            if dtype is None:
-                message = (
-                    f"Unable to infer the numpy data type for "
-                    f"requested field: {requested_field}"
-                )
-                raise ValueError(message)
+    def __getattr__(self, key: str) -> Union[list, np.ndarray]:
+        """Return data lists or numpy arrays for the data, if requested.
 
-        # Convert the data and return the numpy array
-        return np.array(getattr(self, requested_field), dtype=dtype)
+        Numpy arrays are requested in the form field_name + '_numpy', and are returned
+        without copying the parsed arrays. Lists are generated from the arrays here, and
+        stored on first access.
+
+        Args:
+            key: data field to return as list, or as numpy array if suffixed '_numpy'.
+
+        Returns:
+            list or numpy array of requested data field.
+
+        Raises:
+            RuntimeError: Unable to import numpy.
+            AttributeError: Key is not in data_fields.
+        """
+        # Look up the instance dict directly, getattr would recurse before parsing
+        arrays = self.__dict__.get("_arrays")
+        if arrays is not None:
+            if key in arrays:
+                values = arrays[key].tolist()
+                setattr(self, key, values)
+                return values
+            # Check the suffix first, so other misses do not slice the key
+            if key.endswith("_numpy") and key[:-6] in arrays:
+                return arrays[key[:-6]]
+        elif key.endswith("_numpy") and not GOT_NUMPY:
+            # Without numpy the data is only parsed into lists, raises RuntimeError
+            return self.get_numpy(key[:-6])
+
+        # __getattr__ is only called after the check of whether the key is in the
+        # instance dict, therefore it is ok to raise attribute error at this point
+        message = f"{self.__class__} object has no attribute {key}"
+        raise AttributeError(message)
 
     @property
     def data_field_names(self) -> List[str]:
-        """Return a list of data fields names (besides time)."""
-        return [data_field.name for data_field in self.data_fields]
+        """Return a list of data fields names (besides time and blank fields)."""
+        # Copy of the cached names, so callers can not modify them
+        return list(self._data_field_names)
 
 
 class Technique:
@@ -1150,6 +1264,10 @@ class Technique:
 
     data_fields: List[Dict[str, List[DataField]]]
 
+    # Parameter arrays shared by techniques with identical arguments, keyed by
+    # technique class, arguments and EClib library
+    _c_args_cache: Dict[Hashable, Array[TECCParam]] = {}
+
     def __init__(self, args: tuple, technique_filename: str) -> None:
         """Initialize a technique.
 
@@ -1188,10 +1306,33 @@ class Technique:
                 * -10011 means that the value cannot be converted with the conversion
                   function
         """
-        if not hasattr(self, "_c_args"):
+        if hasattr(self, "_c_args"):
+            return self._c_args
+
+        cache = Technique._c_args_cache
+        key = (type(self), _hashable(self.args), instrument._eclib)
+        try:
+            hash(key)
+        except TypeError:
+            # Arguments of other unhashable types are valid, but are not cached
             self._init_c_args(instrument)
+            return self._c_args
+        if key in cache:
+            self._c_args = cache[key]
+            return self._c_args
+
+        self._init_c_args(instrument)
+        if len(cache) >= C_ARGS_CACHE_SIZE:
+            # Evict the oldest entry
+            del cache[next(iter(cache))]
+        cache[key] = self._c_args
         return self._c_args
 
+    @classmethod
+    def clear_c_args_cache(cls) -> None:
+        """Clear parameter arrays shared between techniques with identical arguments."""
+        Technique._c_args_cache.clear()
+
     def _init_c_args(self, instrument: BiologicPotentiostat) -> None:
         """Initialize the arguments structure.
 
@@ -1204,8 +1345,24 @@ class Technique:
             if arg.label == "Step_number":
                 step_number = arg.value + 1
 
-        param: TECCParam
-        constructed_args = []
+        # Count the parameters so the array is allocated once and filled in place
+        number_of_params = 0
+        for arg in self.args:
+            if isinstance(arg.type, dict) or not _parse_arg_type(arg.type)[0]:
+                number_of_params += 1
+            else:
+                number_of_params += min(step_number, len(arg.value))
+        # Only set self._c_args when complete, since c_args checks for its presence
+        c_args = (TECCParam * number_of_params)()
+        param_index = 0
+
+        # Conversion methods of the instrument instance, by argument type
+        conversion_functions = {
+            "bool": instrument.define_bool_parameter,
+            "single": instrument.define_single_parameter,
+            "integer": instrument.define_integer_parameter,
+        }
+
         for arg in self.args:
             # Bounds check the argument
             self._check_arg(arg)
@@ -1215,51 +1372,43 @@ class Technique:
             # reversing it be able to look up codes from strs and replace
             # value
             if isinstance(arg.type, dict):
-                value = reverse_dict(arg.type)[arg.value]
-                param = TECCParam()
-                instrument.define_integer_parameter(arg.label, value, 0, param)
-                constructed_args.append(param)
+                value = _reverse_codes(arg.type)[arg.value]
+                instrument.define_integer_parameter(
+                    arg.label, value, 0, c_args[param_index]
+                )
+                param_index += 1
                 continue
 
             # Get the appropriate conversion function, to populate the EccParam
-            stripped_type = arg.type.strip("[]")
-            try:
-                # Get the conversion method from the instrument instance, this
-                # is named something like defined_bool_parameter
-                conversion_function = getattr(
-                    instrument, f"define_{stripped_type}_parameter"
-                )
-            except AttributeError as exc:
+            is_array, stripped_type = _parse_arg_type(arg.type)
+            conversion_function = conversion_functions.get(stripped_type)
+            if conversion_function is None:
                 message = (
                     f"Unable to find parameter definitions function for "
                     f"type: {stripped_type}"
                 )
-                raise ECLibCustomException(message, -10010) from exc
+                raise ECLibCustomException(message, -10010)
 
             # If the parameter is not a multistep paramter, put the value in a
             # list so we can iterate over it
-            if arg.type.startswith("[") and arg.type.endswith("]"):
-                values = arg.value
-            else:
-                values = [arg.value]
+            values = arg.value if is_array else [arg.value]
 
             # Iterate over all the steps for the parameter (for most will just
             # be 1)
             for index in range(min(step_number, len(values))):
-                param = TECCParam()
                 try:
-                    conversion_function(arg.label, values[index], index, param)
+                    conversion_function(
+                        arg.label, values[index], index, c_args[param_index]
+                    )
                 except ECLibError as exc:
                     message = (
                         f"{values[index]} is not a valid value for conversion "
                         f"to type {stripped_type} for argument '{arg.label}'"
                     )
                     raise ECLibCustomException(message, -10011) from exc
-                constructed_args.append(param)
+                param_index += 1
 
-        self._c_args = (TECCParam * len(constructed_args))()
-        for index, param in enumerate(constructed_args):
-            self._c_args[index] = param
+        self._c_args = c_args
 
     @staticmethod
     def _check_arg(arg: TechniqueArgument) -> None:
@@ -1268,11 +1417,7 @@ class Technique:
             return
 
         # If the type is not a dict (used for constants) and indicates an array
-        if (
-            not isinstance(arg.type, dict)
-            and arg.type.startswith("[")
-            and arg.type.endswith("]")
-        ):
+        if not isinstance(arg.type, dict) and _parse_arg_type(arg.type)[0]:
             values = arg.value
         else:
             values = [arg.value]
@@ -1355,9 +1500,7 @@ class OCV(Technique):
             TechniqueArgument("Rest_time_T", "single", duration, ">=", 0),
             TechniqueArgument("Record_every_dE", "single", record_every_de, ">=", 0),
             TechniqueArgument("Record_every_dT", "single", record_every_dt, ">=", 0),
-            TechniqueArgument(
-                "E_Range", E_RANGES, e_range, "in", list(E_RANGES.values())
-            ),
+            TechniqueArgument("E_Range", E_RANGES, e_range, "in", _E_RANGE_VALUES),
         )
         super().__init__(args, "ocv.ecc")
 
@@ -1440,19 +1583,19 @@ class CV(Technique):
             message = f"Input 'voltage' must be of length 4, not {len(voltage)}"
             raise ValueError(message)
 
-        voltage_list = list(voltage)
-        voltage_list.insert(3, voltage[0])
+        # The scan returns to the initial voltage before the final voltage
+        voltage_list = (voltage[0], voltage[1], voltage[2], voltage[0], voltage[3])
 
         args = (
             TechniqueArgument(
-                "vs_initial", "[bool]", (vs_initial,) * 5, "in", [True, False]
+                "vs_initial", "[bool]", (vs_initial,) * 5, "in", _BOOL_VALUES
             ),
             TechniqueArgument("Voltage_step", "[single]", voltage_list, None, None),
             TechniqueArgument("Scan_Rate", "[single]", (scan_rate,) * 5, ">=", 0.0),
             TechniqueArgument("Scan_number", "integer", 2, None, None),
             TechniqueArgument("Record_every_dE", "single", record_every_de, ">=", 0.0),
             TechniqueArgument(
-                "Average_over_dE", "bool", average_i_over_de, "in", [True, False]
+                "Average_over_dE", "bool", average_i_over_de, "in", _BOOL_VALUES
             ),
             TechniqueArgument("N_Cycles", "integer", n_cycles, ">=", 0),
             TechniqueArgument(
@@ -1469,14 +1612,10 @@ class CV(Technique):
                 "in_float_range",
                 (0.0, 1.0),
             ),
+            TechniqueArgument("I_Range", I_RANGES, i_range, "in", _I_RANGE_VALUES),
+            TechniqueArgument("E_Range", E_RANGES, e_range, "in", _E_RANGE_VALUES),
             TechniqueArgument(
-                "I_Range", I_RANGES, i_range, "in", list(I_RANGES.values())
-            ),
-            TechniqueArgument(
-                "E_Range", E_RANGES, e_range, "in", list(E_RANGES.values())
-            ),
-            TechniqueArgument(
-                "Bandwidth", BANDWIDTHS, bandwidth, "in", list(BANDWIDTHS.values())
+                "Bandwidth", BANDWIDTHS, bandwidth, "in", _BANDWIDTH_VALUES
             ),
         )
         super().__init__(args, "cv.ecc")
@@ -1574,14 +1713,14 @@ class CVA(Technique):
 
         args = (
             TechniqueArgument(
-                "vs_initial_scan", "[bool]", (vs_initial,) * 4, "in", [True, False]
+                "vs_initial_scan", "[bool]", (vs_initial,) * 4, "in", _BOOL_VALUES
             ),
             TechniqueArgument("Voltage_scan", "[single]", voltage, None, None),
             TechniqueArgument("Scan_Rate", "[single]", (scan_rate,) * 4, ">=", 0.0),
             TechniqueArgument("Scan_number", "integer", 2, None, None),
             TechniqueArgument("Record_every_dE", "single", record_every_de, ">=", 0.0),
             TechniqueArgument(
-                "Average_over_dE", "bool", average_over_de, "in", [True, False]
+                "Average_over_dE", "bool", average_over_de, "in", _BOOL_VALUES
             ),
             TechniqueArgument("N_Cycles", "integer", n_cycles, ">=", 0),
             TechniqueArgument(
@@ -1599,7 +1738,7 @@ class CVA(Technique):
                 (0.0, 1.0),
             ),
             TechniqueArgument(
-                "vs_initial_step", "[bool]", (vs_initial,) * 2, "in", [True, False]
+                "vs_initial_step", "[bool]", (vs_initial,) * 2, "in", _BOOL_VALUES
             ),
             TechniqueArgument(
                 "Voltage_step", "[single]", (voltage[1], voltage[2]), None, None
@@ -1615,16 +1754,12 @@ class CVA(Technique):
             TechniqueArgument("Record_every_dT", "single", record_every_dt, ">=", 0.0),
             TechniqueArgument("Record_every_dI", "single", record_every_di, ">=", 0.0),
             TechniqueArgument(
-                "Trig_on_off", "bool", trigger_on_off, "in", [True, False]
-            ),
-            TechniqueArgument(
-                "I_Range", I_RANGES, i_range, "in", list(I_RANGES.values())
+                "Trig_on_off", "bool", trigger_on_off, "in", _BOOL_VALUES
             ),
+            TechniqueArgument("I_Range", I_RANGES, i_range, "in", _I_RANGE_VALUES),
+            TechniqueArgument("E_Range", E_RANGES, e_range, "in", _E_RANGE_VALUES),
             TechniqueArgument(
-                "E_Range", E_RANGES, e_range, "in", list(E_RANGES.values())
-            ),
-            TechniqueArgument(
-                "Bandwidth", BANDWIDTHS, bandwidth, "in", list(BANDWIDTHS.values())
+                "Bandwidth", BANDWIDTHS, bandwidth, "in", _BANDWIDTH_VALUES
             ),
         )
         super().__init__(args, "biovscan.ecc")
@@ -1701,23 +1836,23 @@ class CP(Technique):
                 "[bool]",
                 (vs_initial,) * len(current_step),
                 "in",
-                [True, False],
+                _BOOL_VALUES,
             ),
             TechniqueArgument("Duration_step", "[single]", duration_step, ">=", 0),
             TechniqueArgument(
-                "Step_number", "integer", len(current_step) - 1, "in", list(range(99))
+                "Step_number",
+                "integer",
+                len(current_step) - 1,
+                "in",
+                _STEP_NUMBER_VALUES,
             ),
             TechniqueArgument("Record_every_dT", "single", record_every_dt, ">=", 0),
             TechniqueArgument("Record_every_dE", "single", record_every_de, ">=", 0),
             TechniqueArgument("N_Cycles", "integer", n_cycles, ">=", 0),
+            TechniqueArgument("I_Range", I_RANGES, i_range, "in", _I_RANGE_VALUES),
+            TechniqueArgument("E_Range", E_RANGES, e_range, "in", _E_RANGE_VALUES),
             TechniqueArgument(
-                "I_Range", I_RANGES, i_range, "in", list(I_RANGES.values())
-            ),
-            TechniqueArgument(
-                "E_Range", E_RANGES, e_range, "in", list(E_RANGES.values())
-            ),
-            TechniqueArgument(
-                "Bandwidth", BANDWIDTHS, bandwidth, "in", list(BANDWIDTHS.values())
+                "Bandwidth", BANDWIDTHS, bandwidth, "in", _BANDWIDTH_VALUES
             ),
         )
         super().__init__(args, "cp.ecc")
@@ -1793,22 +1928,22 @@ class CA(Technique):
 
         args = (
             TechniqueArgument("Voltage_step", "[single]", voltage_step, None, None),
-            TechniqueArgument("vs_initial", "[bool]", vs_initial, "in", [True, False]),
+            TechniqueArgument("vs_initial", "[bool]", vs_initial, "in", _BOOL_VALUES),
             TechniqueArgument("Duration_step", "[single]", duration_step, ">=", 0.0),
             TechniqueArgument(
-                "Step_number", "integer", len(voltage_step) - 1, "in", list(range(99))
+                "Step_number",
+                "integer",
+                len(voltage_step) - 1,
+                "in",
+                _STEP_NUMBER_VALUES,
             ),
             TechniqueArgument("Record_every_dT", "single", record_every_dt, ">=", 0.0),
             TechniqueArgument("Record_every_dI", "single", record_every_di, ">=", 0.0),
             TechniqueArgument("N_Cycles", "integer", n_cycles, ">=", 0),
+            TechniqueArgument("I_Range", I_RANGES, i_range, "in", _I_RANGE_VALUES),
+            TechniqueArgument("E_Range", E_RANGES, e_range, "in", _E_RANGE_VALUES),
             TechniqueArgument(
-                "I_Range", I_RANGES, i_range, "in", list(I_RANGES.values())
-            ),
-            TechniqueArgument(
-                "E_Range", E_RANGES, e_range, "in", list(E_RANGES.values())
-            ),
-            TechniqueArgument(
-                "Bandwidth", BANDWIDTHS, bandwidth, "in", list(BANDWIDTHS.values())
+                "Bandwidth", BANDWIDTHS, bandwidth, "in", _BANDWIDTH_VALUES
             ),
         )
         super().__init__(args, "ca.ecc")
@@ -1879,37 +2014,69 @@ class CPOWER(Technique):
             ValueError: On bad lengths for the list arguments
         """
         if not len(power_step) == len(duration_step):
-            message = (
-                "The length of voltage_step, vs_initial and "
-                "duration_step must be the same"
-            )
+            message = "The length of power_step and duration_step must be the same."
             raise ValueError(message)
 
         vs_initial = (vs_initial,) * len(power_step)
 
         args = (
             TechniqueArgument("Power_step", "[single]", power_step, None, None),
-            TechniqueArgument("vs_initial", "[bool]", vs_initial, "in", [True, False]),
+            TechniqueArgument("vs_initial", "[bool]", vs_initial, "in", _BOOL_VALUES),
             TechniqueArgument("Duration_step", "[single]", duration_step, ">=", 0.0),
             TechniqueArgument(
-                "Step_number", "integer", len(power_step) - 1, "in", list(range(99))
+                "Step_number", "integer", len(power_step) - 1, "in", _STEP_NUMBER_VALUES
             ),
             TechniqueArgument("Record_every_dT", "single", record_every_dt, ">=", 0.0),
             TechniqueArgument("Record_every_dE", "single", record_every_de, ">=", 0.0),
             TechniqueArgument("N_Cycles", "integer", n_cycles, ">=", 0),
+            TechniqueArgument("I_Range", I_RANGES, i_range, "in", _I_RANGE_VALUES),
+            TechniqueArgument("E_Range", E_RANGES, e_range, "in", _E_RANGE_VALUES),
             TechniqueArgument(
-                "I_Range", I_RANGES, i_range, "in", list(I_RANGES.values())
-            ),
-            TechniqueArgument(
-                "E_Range", E_RANGES, e_range, "in", list(E_RANGES.values())
-            ),
-            TechniqueArgument(
-                "Bandwidth", BANDWIDTHS, bandwidth, "in", list(BANDWIDTHS.values())
+                "Bandwidth", BANDWIDTHS, bandwidth, "in", _BANDWIDTH_VALUES
             ),
         )
         super().__init__(args, "pow.ecc")
 
 
+# Data fields of the impedance techniques, shared by PEIS and GEIS
+_EIS_SP300_PROCESS1_DATA_FIELDS = [
+    DataField("freq", c_float),
+    DataField("abs_Ewe", c_float),
+    DataField("abs_I", c_float),
+    DataField("Phase_Zwe", c_float),
+    DataField("Ewe", c_float),
+    DataField("I", c_float),
+    DataField("Blank0", c_float),
+    DataField("abs_Ece", c_float),
+    DataField("abs_Ice", c_float),
+    DataField("Phase_Zce", c_float),
+    DataField("Ece", c_float),
+    DataField("Blank1", c_float),
+    DataField("Blank2", c_float),
+    DataField("t", c_float),
+]
+_EIS_PROCESS0_DATA_FIELDS = {
+    "common": [
+        DataField("Ewe", c_float),
+        DataField("I", c_float),
+    ],
+}
+_EIS_PROCESS1_DATA_FIELDS = {
+    "vmp3": _EIS_SP300_PROCESS1_DATA_FIELDS + [DataField("Irange", c_uint32)],
+    "sp300": _EIS_SP300_PROCESS1_DATA_FIELDS,
+}
+# The staircase variants SPEIS and SGEIS additionally record the step number
+_STEP_DATA_FIELD = DataField("step", c_uint32)
+_STAIRCASE_EIS_PROCESS0_DATA_FIELDS = {
+    series: fields + [_STEP_DATA_FIELD]
+    for series, fields in _EIS_PROCESS0_DATA_FIELDS.items()
+}
+_STAIRCASE_EIS_PROCESS1_DATA_FIELDS = {
+    series: fields + [_STEP_DATA_FIELD]
+    for series, fields in _EIS_PROCESS1_DATA_FIELDS.items()
+}
+
+
 # Section 7.11 in the specification
 class PEIS(Technique):
     """Potentio Electrochemical Impedance Spectroscopy (PEIS) technique class.
@@ -1942,48 +2109,9 @@ class PEIS(Technique):
     """
 
     # :Data fields definition
-    process0_data_fields = {
-        "common": [
-            DataField("Ewe", c_float),
-            DataField("I", c_float),
-        ],
-    }
-
-    process1_data_fields = {
-        "vmp3": [
-            DataField("freq", c_float),
-            DataField("abs_Ewe", c_float),
-            DataField("abs_I", c_float),
-            DataField("Phase_Zwe", c_float),
-            DataField("Ewe", c_float),
-            DataField("I", c_float),
-            DataField("Blank0", c_float),
-            DataField("abs_Ece", c_float),
-            DataField("abs_Ice", c_float),
-            DataField("Phase_Zce", c_float),
-            DataField("Ece", c_float),
-            DataField("Blank1", c_float),
-            DataField("Blank2", c_float),
-            DataField("t", c_float),
-            DataField("Irange", c_uint32),
-        ],
-        "sp300": [
-            DataField("freq", c_float),
-            DataField("abs_Ewe", c_float),
-            DataField("abs_I", c_float),
-            DataField("Phase_Zwe", c_float),
-            DataField("Ewe", c_float),
-            DataField("I", c_float),
-            DataField("Blank0", c_float),
-            DataField("abs_Ece", c_float),
-            DataField("abs_Ice", c_float),
-            DataField("Phase_Zce", c_float),
-            DataField("Ece", c_float),
-            DataField("Blank1", c_float),
-            DataField("Blank2", c_float),
-            DataField("t", c_float),
-        ],
-    }
+    process0_data_fields = _EIS_PROCESS0_DATA_FIELDS
+
+    process1_data_fields = _EIS_PROCESS1_DATA_FIELDS
 
     data_fields = [process0_data_fields, process1_data_fields]
 
@@ -2033,7 +2161,7 @@ class PEIS(Technique):
                 :data:`BANDWIDTHS` module variable for possible values
         """
         args = (
-            TechniqueArgument("vs_initial", "bool", vs_initial, "in", [True, False]),
+            TechniqueArgument("vs_initial", "bool", vs_initial, "in", _BOOL_VALUES),
             TechniqueArgument("vs_final", "bool", vs_initial, None, None),
             TechniqueArgument(
                 "Initial_Voltage_step", "single", initial_voltage_step, None, None
@@ -2050,7 +2178,7 @@ class PEIS(Technique):
                 "Initial_frequency", "single", initial_frequency, ">=", 0.0
             ),
             TechniqueArgument(
-                "sweep", "bool", not logarithmic_spacing, "in", [True, False]
+                "sweep", "bool", not logarithmic_spacing, "in", _BOOL_VALUES
             ),
             TechniqueArgument(
                 "Amplitude_Voltage", "single", amplitude_voltage, None, None
@@ -2058,17 +2186,13 @@ class PEIS(Technique):
             TechniqueArgument("Frequency_number", "integer", frequency_number, ">=", 1),
             TechniqueArgument("Average_N_times", "integer", average_n_times, ">=", 1),
             TechniqueArgument(
-                "Correction", "bool", drift_correction, "in", [True, False]
+                "Correction", "bool", drift_correction, "in", _BOOL_VALUES
             ),
             TechniqueArgument("Wait_for_steady", "single", wait_for_steady, ">=", 0.0),
+            TechniqueArgument("I_Range", I_RANGES, i_range, "in", _I_RANGE_VALUES),
+            TechniqueArgument("E_Range", E_RANGES, e_range, "in", _E_RANGE_VALUES),
             TechniqueArgument(
-                "I_Range", I_RANGES, i_range, "in", list(I_RANGES.values())
-            ),
-            TechniqueArgument(
-                "E_Range", E_RANGES, e_range, "in", list(E_RANGES.values())
-            ),
-            TechniqueArgument(
-                "Bandwidth", BANDWIDTHS, bandwidth, "in", list(BANDWIDTHS.values())
+                "Bandwidth", BANDWIDTHS, bandwidth, "in", _BANDWIDTH_VALUES
             ),
         )
         super().__init__(args, "peis.ecc")
@@ -2109,51 +2233,9 @@ class SPEIS(Technique):
     """
 
     # :Data fields definition
-    _process0_data_fields = {
-        "common": [
-            DataField("Ewe", c_float),
-            DataField("I", c_float),
-            DataField("step", c_uint32),
-        ],
-    }
-
-    _process1_data_fields = {
-        "vmp3": [
-            DataField("freq", c_float),
-            DataField("abs_Ewe", c_float),
-            DataField("abs_I", c_float),
-            DataField("Phase_Zwe", c_float),
-            DataField("Ewe", c_float),
-            DataField("I", c_float),
-            DataField("Blank0", c_float),
-            DataField("abs_Ece", c_float),
-            DataField("abs_Ice", c_float),
-            DataField("Phase_Zce", c_float),
-            DataField("Ece", c_float),
-            DataField("Blank1", c_float),
-            DataField("Blank2", c_float),
-            DataField("t", c_float),
-            DataField("Irange", c_uint32),
-            DataField("step", c_uint32),
-        ],
-        "sp300": [
-            DataField("freq", c_float),
-            DataField("abs_Ewe", c_float),
-            DataField("abs_I", c_float),
-            DataField("Phase_Zwe", c_float),
-            DataField("Ewe", c_float),
-            DataField("I", c_float),
-            DataField("Blank0", c_float),
-            DataField("abs_Ece", c_float),
-            DataField("abs_Ice", c_float),
-            DataField("Phase_Zce", c_float),
-            DataField("Ece", c_float),
-            DataField("Blank1", c_float),
-            DataField("Blank2", c_float),
-            DataField("t", c_float),
-            DataField("step", c_uint32),
-        ],
-    }
+    _process0_data_fields = _STAIRCASE_EIS_PROCESS0_DATA_FIELDS
+
+    _process1_data_fields = _STAIRCASE_EIS_PROCESS1_DATA_FIELDS
 
     data_fields = [_process0_data_fields, _process1_data_fields]
 
@@ -2208,8 +2290,8 @@ class SPEIS(Technique):
 
         """
         args = (
-            TechniqueArgument("vs_initial", "bool", vs_initial, "in", [True, False]),
-            TechniqueArgument("vs_final", "bool", vs_initial, "in", [True, False]),
+            TechniqueArgument("vs_initial", "bool", vs_initial, "in", _BOOL_VALUES),
+            TechniqueArgument("vs_final", "bool", vs_initial, "in", _BOOL_VALUES),
             TechniqueArgument(
                 "Initial_Voltage_step", "single", initial_voltage_step, None, None
             ),
@@ -2218,7 +2300,7 @@ class SPEIS(Technique):
             ),
             TechniqueArgument("Duration_step", "single", duration_step, None, None),
             TechniqueArgument(
-                "Step_number", "integer", step_number, "in", list(range(99))
+                "Step_number", "integer", step_number, "in", _STEP_NUMBER_VALUES
             ),
             TechniqueArgument("Record_every_dT", "single", record_every_dt, ">=", 0.0),
             TechniqueArgument("Record_every_dI", "single", record_every_di, ">=", 0.0),
@@ -2227,7 +2309,7 @@ class SPEIS(Technique):
                 "Initial_frequency", "single", initial_frequency, ">=", 0.0
             ),
             TechniqueArgument(
-                "sweep", "bool", not logarithmic_spacing, "in", [True, False]
+                "sweep", "bool", not logarithmic_spacing, "in", _BOOL_VALUES
             ),
             TechniqueArgument(
                 "Amplitude_Voltage", "single", amplitude_voltage, None, None
@@ -2235,17 +2317,13 @@ class SPEIS(Technique):
             TechniqueArgument("Frequency_number", "integer", frequency_number, ">=", 1),
             TechniqueArgument("Average_N_times", "integer", average_n_times, ">=", 1),
             TechniqueArgument(
-                "Correction", "bool", drift_correction, "in", [True, False]
+                "Correction", "bool", drift_correction, "in", _BOOL_VALUES
             ),
             TechniqueArgument("Wait_for_steady", "single", wait_for_steady, ">=", 0.0),
+            TechniqueArgument("I_Range", I_RANGES, i_range, "in", _I_RANGE_VALUES),
+            TechniqueArgument("E_Range", E_RANGES, e_range, "in", _E_RANGE_VALUES),
             TechniqueArgument(
-                "I_Range", I_RANGES, i_range, "in", list(I_RANGES.values())
-            ),
-            TechniqueArgument(
-                "E_Range", E_RANGES, e_range, "in", list(E_RANGES.values())
-            ),
-            TechniqueArgument(
-                "Bandwidth", BANDWIDTHS, bandwidth, "in", list(BANDWIDTHS.values())
+                "Bandwidth", BANDWIDTHS, bandwidth, "in", _BANDWIDTH_VALUES
             ),
         )
         super().__init__(args, "seisp.ecc")
@@ -2284,48 +2362,11 @@ class GEIS(Technique):
     """
 
     # :Data fields definition
-    process0_data_fields = {
-        "common": [
-            DataField("Ewe", c_float),
-            DataField("I", c_float),
-        ],
-    }
-
-    process1_data_fields = {
-        "vmp3": [
-            DataField("freq", c_float),
-            DataField("abs_Ewe", c_float),
-            DataField("abs_I", c_float),
-            DataField("Phase_Zwe", c_float),
-            DataField("Ewe", c_float),
-            DataField("I", c_float),
-            DataField("Blank0", c_float),
-            DataField("abs_Ece", c_float),
-            DataField("abs_Ice", c_float),
-            DataField("Phase_Zce", c_float),
-            DataField("Ece", c_float),
-            DataField("Blank1", c_float),
-            DataField("Blank2", c_float),
-            DataField("t", c_float),
-            DataField("Irange", c_uint32),
-        ],
-        "sp300": [
-            DataField("freq", c_float),
-            DataField("abs_Ewe", c_float),
-            DataField("abs_I", c_float),
-            DataField("Phase_Zwe", c_float),
-            DataField("Ewe", c_float),
-            DataField("I", c_float),
-            DataField("Blank0", c_float),
-            DataField("abs_Ece", c_float),
-            DataField("abs_Ice", c_float),
-            DataField("Phase_Zce", c_float),
-            DataField("Ece", c_float),
-            DataField("Blank1", c_float),
-            DataField("Blank2", c_float),
-            DataField("t", c_float),
-        ],
-    }
+    process0_data_fields = _EIS_PROCESS0_DATA_FIELDS
+
+    process1_data_fields = _EIS_PROCESS1_DATA_FIELDS
+
+    data_fields = [process0_data_fields, process1_data_fields]
 
     def __init__(
         self,
@@ -2374,7 +2415,7 @@ class GEIS(Technique):
 
         """
         args = (
-            TechniqueArgument("vs_initial", "bool", vs_initial, "in", [True, False]),
+            TechniqueArgument("vs_initial", "bool", vs_initial, "in", _BOOL_VALUES),
             TechniqueArgument("vs_final", "bool", vs_initial, None, None),
             TechniqueArgument(
                 "Initial_Current_step", "single", initial_current_step, None, None
@@ -2391,7 +2432,7 @@ class GEIS(Technique):
                 "Initial_frequency", "single", initial_frequency, ">=", 0.0
             ),
             TechniqueArgument(
-                "sweep", "bool", not logarithmic_spacing, "in", [True, False]
+                "sweep", "bool", not logarithmic_spacing, "in", _BOOL_VALUES
             ),
             TechniqueArgument(
                 "Amplitude_Current", "single", amplitude_current, None, None
@@ -2399,17 +2440,13 @@ class GEIS(Technique):
             TechniqueArgument("Frequency_number", "integer", frequency_number, ">=", 1),
             TechniqueArgument("Average_N_times", "integer", average_n_times, ">=", 1),
             TechniqueArgument(
-                "Correction", "bool", drift_correction, "in", [True, False]
+                "Correction", "bool", drift_correction, "in", _BOOL_VALUES
             ),
             TechniqueArgument("Wait_for_steady", "single", wait_for_steady, ">=", 0.0),
+            TechniqueArgument("I_Range", I_RANGES, i_range, "in", _I_RANGE_VALUES),
+            TechniqueArgument("E_Range", E_RANGES, e_range, "in", _E_RANGE_VALUES),
             TechniqueArgument(
-                "I_Range", I_RANGES, i_range, "in", list(I_RANGES.values())
-            ),
-            TechniqueArgument(
-                "E_Range", E_RANGES, e_range, "in", list(E_RANGES.values())
-            ),
-            TechniqueArgument(
-                "Bandwidth", BANDWIDTHS, bandwidth, "in", list(BANDWIDTHS.values())
+                "Bandwidth", BANDWIDTHS, bandwidth, "in", _BANDWIDTH_VALUES
             ),
         )
         super().__init__(args, "geis.ecc")
@@ -2449,51 +2486,9 @@ class SGEIS(Technique):
     """
 
     # :Data fields definition
-    process0_data_fields = {
-        "common": [
-            DataField("Ewe", c_float),
-            DataField("I", c_float),
-            DataField("step", c_uint32),
-        ],
-    }
-
-    process1_data_fields = {
-        "vmp3": [
-            DataField("freq", c_float),
-            DataField("abs_Ewe", c_float),
-            DataField("abs_I", c_float),
-            DataField("Phase_Zwe", c_float),
-            DataField("Ewe", c_float),
-            DataField("I", c_float),
-            DataField("Blank0", c_float),
-            DataField("abs_Ece", c_float),
-            DataField("abs_Ice", c_float),
-            DataField("Phase_Zce", c_float),
-            DataField("Ece", c_float),
-            DataField("Blank1", c_float),
-            DataField("Blank2", c_float),
-            DataField("t", c_float),
-            DataField("Irange", c_uint32),
-            DataField("step", c_uint32),
-        ],
-        "sp300": [
-            DataField("freq", c_float),
-            DataField("abs_Ewe", c_float),
-            DataField("abs_I", c_float),
-            DataField("Phase_Zwe", c_float),
-            DataField("Ewe", c_float),
-            DataField("I", c_float),
-            DataField("Blank0", c_float),
-            DataField("abs_Ece", c_float),
-            DataField("abs_Ice", c_float),
-            DataField("Phase_Zce", c_float),
-            DataField("Ece", c_float),
-            DataField("Blank1", c_float),
-            DataField("Blank2", c_float),
-            DataField("t", c_float),
-            DataField("step", c_uint32),
-        ],
-    }
+    process0_data_fields = _STAIRCASE_EIS_PROCESS0_DATA_FIELDS
+
+    process1_data_fields = _STAIRCASE_EIS_PROCESS1_DATA_FIELDS
 
     data_fields = [process0_data_fields, process1_data_fields]
 
@@ -2545,8 +2540,8 @@ class SGEIS(Technique):
                 :data:`BANDWIDTHS` module variable for possible values.
         """
         args = (
-            TechniqueArgument("vs_initial", "bool", vs_initial, "in", [True, False]),
-            TechniqueArgument("vs_final", "bool", vs_initial, "in", [True, False]),
+            TechniqueArgument("vs_initial", "bool", vs_initial, "in", _BOOL_VALUES),
+            TechniqueArgument("vs_final", "bool", vs_initial, "in", _BOOL_VALUES),
             TechniqueArgument(
                 "Initial_Current_step", "single", initial_current_step, None, None
             ),
@@ -2555,7 +2550,7 @@ class SGEIS(Technique):
             ),
             TechniqueArgument("Duration_step", "single", duration_step, None, None),
             TechniqueArgument(
-                "Step_number", "integer", step_number, "in", list(range(99))
+                "Step_number", "integer", step_number, "in", _STEP_NUMBER_VALUES
             ),
             TechniqueArgument("Record_every_dT", "single", record_every_dt, ">=", 0.0),
             TechniqueArgument("Record_every_dE", "single", record_every_de, ">=", 0.0),
@@ -2564,7 +2559,7 @@ class SGEIS(Technique):
                 "Initial_frequency", "single", initial_frequency, ">=", 0.0
             ),
             TechniqueArgument(
-                "sweep", "bool", not logarithmic_spacing, "in", [True, False]
+                "sweep", "bool", not logarithmic_spacing, "in", _BOOL_VALUES
             ),
             TechniqueArgument(
                 "Amplitude_Current", "single", amplitude_current, None, None
@@ -2572,17 +2567,13 @@ class SGEIS(Technique):
             TechniqueArgument("Frequency_number", "integer", frequency_number, ">=", 1),
             TechniqueArgument("Average_N_times", "integer", average_n_times, ">=", 1),
             TechniqueArgument(
-                "Correction", "bool", drift_correction, "in", [True, False]
+                "Correction", "bool", drift_correction, "in", _BOOL_VALUES
             ),
             TechniqueArgument("Wait_for_steady", "single", wait_for_steady, ">=", 0.0),
+            TechniqueArgument("I_Range", I_RANGES, i_range, "in", _I_RANGE_VALUES),
+            TechniqueArgument("E_Range", E_RANGES, e_range, "in", _E_RANGE_VALUES),
             TechniqueArgument(
-                "I_Range", I_RANGES, i_range, "in", list(I_RANGES.values())
-            ),
-            TechniqueArgument(
-                "E_Range", E_RANGES, e_range, "in", list(E_RANGES.values())
-            ),
-            TechniqueArgument(
-                "Bandwidth", BANDWIDTHS, bandwidth, "in", list(BANDWIDTHS.values())
+                "Bandwidth", BANDWIDTHS, bandwidth, "in", _BANDWIDTH_VALUES
             ),
         )
         super().__init__(args, "seisg.ecc")
@@ -2814,12 +2805,360 @@ def structure_to_dict(structure: Structure) -> dict:
     return out
 
 
+@lru_cache(maxsize=None)
+def _load_eclib(path: str) -> WinDLL:
+    """Load the EClib DLL once per path and declare its function prototypes.
+
+    Args:
+        path: Full path of the EClib DLL.
+
+    Returns:
+        The loaded DLL.
+    """
+    eclib = WinDLL(path)
+    _set_prototypes(
+        eclib,
+        {
+            "BL_GetLibVersion": [c_char_p, POINTER(c_uint32)],
+            "BL_GetErrorMsg": [c_int32, c_char_p, POINTER(c_uint32)],
+            "BL_Connect": [c_char_p, c_uint8, POINTER(c_int32), POINTER(DeviceInfos)],
+            "BL_Disconnect": [c_int32],
+            "BL_TestConnection": [c_int32],
+            "BL_LoadFirmware": [
+                c_int32,
+                POINTER(c_uint8),
+                POINTER(c_int32),
+                c_uint8,
+                c_bool,
+                c_bool,
+                c_char_p,
+                c_char_p,
+            ],
+            "BL_IsChannelPlugged": [c_int32, c_uint8],
+            "BL_GetChannelsPlugged": [c_int32, POINTER(c_uint8), c_uint8],
+            "BL_GetChannelInfos": [c_int32, c_uint8, POINTER(ChannelInfos)],
+            "BL_GetMessage": [c_int32, c_uint8, c_char_p, POINTER(c_uint32)],
+            "BL_LoadTechnique": [
+                c_int32,
+                c_uint8,
+                c_char_p,
+                TECCParams,
+                c_bool,
+                c_bool,
+                c_bool,
+            ],
+            "BL_DefineBoolParameter": [c_char_p, c_bool, c_int32, POINTER(TECCParam)],
+            "BL_DefineSglParameter": [c_char_p, c_float, c_int32, POINTER(TECCParam)],
+            "BL_DefineIntParameter": [c_char_p, c_int32, c_int32, POINTER(TECCParam)],
+            "BL_StartChannel": [c_int32, c_uint8],
+            "BL_StartChannels": [
+                c_int32,
+                POINTER(c_uint8),
+                POINTER(c_int32),
+                c_uint8,
+            ],
+            "BL_StopChannel": [c_int32, c_uint8],
+            "BL_StopChannels": [c_int32, POINTER(c_uint8), POINTER(c_int32), c_uint8],
+            "BL_GetCurrentValues": [c_int32, c_uint8, POINTER(CurrentValues)],
+            "BL_GetData": [
+                c_int32,
+                c_uint8,
+                POINTER(c_uint32),
+                POINTER(DataInfos),
+                POINTER(CurrentValues),
+            ],
+        },
+    )
+    # Returns a C bool rather than an error code
+    eclib.BL_IsChannelPlugged.restype = c_bool
+    return eclib
+
+
+@lru_cache(maxsize=None)
+def _load_blfind(path: str) -> WinDLL:
+    """Load the blfind DLL once per path and declare its function prototypes.
+
+    Args:
+        path: Full path of the blfind DLL.
+
+    Returns:
+        The loaded DLL.
+    """
+    blfind = WinDLL(path)
+    find_argtypes = [c_char_p, POINTER(c_uint32), POINTER(c_uint32)]
+    _set_prototypes(
+        blfind,
+        {
+            "BL_FindEChemDev": find_argtypes,
+            "BL_FindEChemEthDev": find_argtypes,
+            "BL_FindEChemUsbDev": find_argtypes,
+            "BL_SetConfig": [c_char_p, c_char_p],
+            "BL_GetErrorMsg": [c_int32, c_char_p, POINTER(c_uint32)],
+        },
+    )
+    return blfind
+
+
+def _set_prototypes(dll: WinDLL, prototypes: Dict[str, list]) -> None:
+    """Declare argument types of DLL functions, all of which return an int32 code.
+
+    Declared prototypes let ctypes convert arguments without inspecting them on every
+    call.
+
+    Args:
+        dll: Loaded DLL.
+        prototypes: Dict of function name to list of ctypes argument types.
+    """
+    for name, argtypes in prototypes.items():
+        function = getattr(dll, name)
+        function.argtypes = argtypes
+        function.restype = c_int32
+
+
+@lru_cache(maxsize=64)
+def _resolve_data_fields(technique: str, process: int, series: str) -> List[DataField]:
+    """Get data fields of a technique, cached since they are static.
+
+    Args:
+        technique: Technique identifier name, e.g. 'KBIO_TECHID_OCV'.
+        process: Process index of the data.
+        series: Instrument series, 'sp300' or 'vmp3'.
+
+    Returns:
+        List of data fields.
+
+    Raises:
+        ECLibCustomException: See :class:`.KBIOData`.
+    """
+    # Get the data_fields class variable from the corresponding technique class
+    if technique not in TECHNIQUE_IDENTIFIERS_TO_CLASS:
+        message = (
+            f"The technique '{technique}' has no entry in "
+            f"TECHNIQUE_IDENTIFIERS_TO_CLASS. The is required to be able to "
+            f"interpret the data."
+        )
+
+        raise ECLibCustomException(message, -20000)
+    technique_class: Type[Technique]
+    technique_class = TECHNIQUE_IDENTIFIERS_TO_CLASS[technique]
+
+    if "data_fields" not in technique_class.__dict__:
+        message = (
+            f"The technique class {technique_class.__name__} does not "
+            f"define a 'data_fields' class variable, which is required "
+            f"for data interpretation."
+        )
+        raise ECLibCustomException(message, -20001)
+
+    data_fields_complete: Dict[str, List[DataField]]
+    data_fields_complete = technique_class.data_fields[process]
+    data_fields_out: List[DataField]
+
+    try:
+        data_fields_out = data_fields_complete["common"]
+    except KeyError:
+        try:
+            data_fields_out = data_fields_complete[series]
+        except KeyError as exc:
+            message = (
+                f"Unable to get data_fields from technique class. The "
+                f"data_fields class variable in the technique class must "
+                f"have either a 'common' or a '{series}' "
+                f"key."
+            )
+            raise ECLibCustomException(message, -20002) from exc
+
+    return data_fields_out
+
+
+@lru_cache(maxsize=64)
+def _resolve_data_field_names(
+    technique: str, process: int, series: str
+) -> Tuple[str, ...]:
+    """Get data field names of a technique, cached since they are static.
+
+    Args:
+        technique: Technique identifier name, e.g. 'KBIO_TECHID_OCV'.
+        process: Process index of the data.
+        series: Instrument series, 'sp300' or 'vmp3'.
+
+    Returns:
+        Tuple of data field names.
+    """
+    data_columns = _resolve_data_columns(technique, process, series)
+    return tuple(data_field.name for _, data_field in data_columns)
+
+
+@lru_cache(maxsize=64)
+def _resolve_data_columns(
+    technique: str, process: int, series: str
+) -> Tuple[Tuple[int, DataField], ...]:
+    """Get the buffer columns of the data fields of a technique to decode.
+
+    Blank data fields only pad the data points, so they are left out.
+
+    Args:
+        technique: Technique identifier name, e.g. 'KBIO_TECHID_OCV'.
+        process: Process index of the data.
+        series: Instrument series, 'sp300' or 'vmp3'.
+
+    Returns:
+        Tuple of column index and data field pairs.
+    """
+    data_fields = _resolve_data_fields(technique, process, series)
+    # Without a `t` field, the first two columns are the high and low time words
+    first_column = 0 if any(data_field.name == "t" for data_field in data_fields) else 2
+    return tuple(
+        (column, data_field)
+        for column, data_field in enumerate(data_fields, first_column)
+        if not data_field.name.startswith("Blank")
+    )
+
+
+@lru_cache(maxsize=64)
+def _resolve_record_dtype(
+    technique: str, process: int, series: str, number_of_columns: int
+) -> np.dtype:
+    """Get the structured dtype of a data point, cached since data fields are static.
+
+    Args:
+        technique: Technique identifier name, e.g. 'KBIO_TECHID_OCV'.
+        process: Process index of the data.
+        series: Instrument series, 'sp300' or 'vmp3'.
+        number_of_columns: Number of columns of a data point in the data buffer.
+
+    Returns:
+        Structured dtype with one field per decoded data field, at the offset of its
+        column.
+    """
+    data_columns = _resolve_data_columns(technique, process, series)
+    size = sizeof(c_uint32)
+    return np.dtype(
+        {
+            "names": [data_field.name for _, data_field in data_columns],
+            "formats": [
+                _FIELD_DTYPES[data_field.type] for _, data_field in data_columns
+            ],
+            "offsets": [column * size for column, _ in data_columns],
+            "itemsize": number_of_columns * size,
+        }
+    )
+
+
+def _parse_time_numpy(
+    raw: np.ndarray, starttime: float, timebase: float, out: np.ndarray
+) -> None:
+    """Compute point times from the high and low time words of a data buffer.
+
+    Args:
+        raw: (points, columns) uint32 data array, columns 0 and 1 being the high and
+            low time words.
+        starttime: Start time of the technique in seconds.
+        timebase: The timebase for the time calculation.
+        out: Output buffer of float64 times, one per point.
+    """
+    # Widen to int64 before shifting, so that no arithmetic happens in uint32
+    ticks = (raw[:, 0].astype(np.int64) << 32) | raw[:, 1].astype(np.int64)
+    np.multiply(ticks, timebase, out=out)
+    np.add(out, starttime, out=out)
+
+
+if GOT_NUMBA:
+
+    @njit(cache=True)
+    def _parse_time_numba(raw, starttime, timebase, out):
+        """Compiled single-pass equivalent of :func:`_parse_time_numpy`."""
+        shift = np.int64(32)
+        for i in range(raw.shape[0]):
+            ticks = (np.int64(raw[i, 0]) << shift) | np.int64(raw[i, 1])
+            out[i] = starttime + timebase * float(ticks)
+
+    _parse_time = _parse_time_numba
+else:
+    _parse_time = _parse_time_numpy
+
+
+@lru_cache(maxsize=None)
+def _parse_arg_type(arg_type: str) -> Tuple[bool, str]:
+    """Parse a technique argument type string, e.g. '[single]'.
+
+    Args:
+        arg_type: Argument type, with ``[]`` around it to indicate an array.
+
+    Returns:
+        Tuple of whether the type is an array and the type without the brackets.
+    """
+    is_array = arg_type.startswith("[") and arg_type.endswith("]")
+    return is_array, arg_type.strip("[]")
+
+
+def _hashable(value: Any) -> Hashable:
+    """Convert nested lists, numpy arrays and dicts to tuples, for use in cache keys.
+
+    Module-level code dicts live as long as the module, so their id identifies them
+    without converting their items.
+    """
+    if GOT_NUMPY and isinstance(value, np.ndarray):
+        return _hashable(value.tolist())
+    if isinstance(value, dict):
+        if id(value) in _REVERSED_CODES:
+            return (dict, id(value))
+        return (dict, tuple((key, _hashable(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_hashable(item) for item in value)
+    return value
+
+
+def _c_channel_array(channels: Sequence[int]) -> Array[c_uint8]:
+    """Convert channel selection to ctypes array, unless it already is one.
+
+    Args:
+        channels: Sequence with 1 integer per channel (usually 16) that indicates
+            whether each channel is selected (0=False and 1=True). May be a
+            preconverted ``c_uint8`` array, which is returned as is.
+
+    Returns:
+        ctypes ``c_uint8`` array of channel selections.
+    """
+    if getattr(channels, "_type_", None) is c_uint8:
+        return channels
+    # Single bulk copy instead of ctypes per-item assignment
+    return (c_uint8 * len(channels)).from_buffer_copy(bytes(channels))
+
+
+def _c_results_list(c_results: Array[c_int32]) -> List[int]:
+    """Convert ctypes array of per-channel result codes to list of integers.
+
+    Uses a single NumPy view of the array if available, instead of indexing the ctypes
+    array one element at a time.
+
+    Args:
+        c_results: ctypes ``c_int32`` array of result codes.
+
+    Returns:
+        List of integer result codes.
+    """
+    if GOT_NUMPY:
+        return np.frombuffer(c_results, dtype=np.int32).tolist()
+    return list(c_results)
+
+
 def reverse_dict(dict_: dict) -> dict:
     """Reverse the key/value status of a dict."""
     return {v: k for k, v in dict_.items()}
 
 
+def _reverse_codes(codes: dict) -> dict:
+    """Reverse a code translation dict, using precomputed reversals for constants."""
+    reversed_codes = _REVERSED_CODES.get(id(codes))
+    if reversed_codes is None:
+        reversed_codes = reverse_dict(codes)
+    return reversed_codes
+
+
 # Constants
+# :Translation table removing separators from device model names, e.g. 'SP-300'
+_MODEL_TRANS = str.maketrans("", "", "- ")
 # :Device number to device name translation dict
 DEVICE_CODES = {
     0: "KBIO_DEV_VMP",
@@ -2948,6 +3287,19 @@ BANDWIDTHS = {
     9: "KBIO_BW_9",
 }
 
+# Accepted boolean, range, bandwidth and step number values, shared by the technique
+# argument checks
+_BOOL_VALUES = (True, False)
+_I_RANGE_VALUES = tuple(I_RANGES.values())
+_E_RANGE_VALUES = tuple(E_RANGES.values())
+_BANDWIDTH_VALUES = tuple(BANDWIDTHS.values())
+_STEP_NUMBER_VALUES = range(99)
+# Reversed translation dicts of dict-typed technique arguments, keyed by id of the
+# module-level dict, which lives as long as the module
+_REVERSED_CODES = {
+    id(codes): reverse_dict(codes) for codes in (I_RANGES, E_RANGES, BANDWIDTHS)
+}
+
 # :Filter number to filter name translation dict
 FILTERS = {
     -1: "KBIO_FILTER_RSRVD",
@@ -2976,6 +3328,27 @@ STATES = {
     2: "KBIO_STATE_PAUSE",
 }
 
+# :Maximum number of technique parameter arrays shared between identical techniques
+C_ARGS_CACHE_SIZE = 128
+
+# :Data field ctypes type to numpy dtype name translation dict
+_FIELD_DTYPES = {c_float: "float32", c_uint32: "uint32"}
+
+# :Data field ctypes type to dtype name of the parsed numpy arrays, which are wide
+# enough to hold the values exactly
+_FIELD_NUMPY_DTYPES = {c_float: "float64", c_uint32: "int64"}
+
+# :Channel infos item, translated item, translation dict and whether unknown codes
+# :raise KeyError
+_CHANNEL_INFO_TRANSLATIONS = (
+    ("FirmwareCode", "FirmwareCode(translated)", FIRMWARE_CODES, True),
+    ("AmpCode", "AmpCode(translated)", AMP_CODES, False),
+    ("State", "State(translated)", STATES, False),
+    ("MaxIRange", "MaxIRange(translated)", I_RANGES, False),
+    ("MinIRange", "MinIRange(translated)", I_RANGES, False),
+    ("MaxBandwidth", "MaxBandwidth", BANDWIDTHS, False),
+)
+
 # :Technique number to technique name translation dict
 TECHNIQUE_IDENTIFIERS = {
     0: "KBIO_TECHID_NONE",
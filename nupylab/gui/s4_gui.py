@@ -13,6 +13,8 @@ python s4_gui.py
 """
 
 import sys
+from functools import partial
+from operator import attrgetter
 from typing import Dict, List
 
 # Instrument Imports #
@@ -21,13 +23,13 @@ from nupylab.instruments.heater.eurotherm2400 import Eurotherm2400 as Heater
 from nupylab.instruments.mfc.rod4 import ROD4 as MFC
 from nupylab.instruments.o2_sensor.keithley2182 import Keithley2182 as PO2_Sensor
 ######################
-from nupylab.utilities import list_resources, nupylab_procedure, nupylab_window
+from nupylab.utilities import nupylab_procedure, nupylab_window
+from nupylab.utilities.nupylab_procedure import ResourceListParameter
 from pymeasure.display.Qt import QtWidgets
 from pymeasure.experiment import (
     BooleanParameter,
     FloatParameter,
     IntegerParameter,
-    ListParameter,
     Parameter,
 )
 
@@ -59,15 +61,13 @@ class S4Procedure(nupylab_procedure.NupylabProcedure):
         "-Z_im (ohm)",
     ]
 
-    resources = list_resources()
-
-    furnace_port = ListParameter("Eurotherm Port", choices=resources)
+    furnace_port = ResourceListParameter("Eurotherm Port")
     furnace_address = IntegerParameter(
         "Eurotherm Address", minimum=1, maximum=254, step=1, default=1
     )
-    mfc_port = ListParameter("ROD-4 Port", choices=resources)
+    mfc_port = ResourceListParameter("ROD-4 Port")
     potentiostat_port = Parameter("Biologic Port", default="192.109.209.128")
-    po2_sensor_port = ListParameter("Keithley Port", choices=resources)
+    po2_sensor_port = ResourceListParameter("Keithley Port")
 
     target_temperature = FloatParameter("Target Temperature", units="C")
     ramp_rate = FloatParameter("Ramp Rate", units="C/min")
@@ -186,7 +186,7 @@ class S4Procedure(nupylab_procedure.NupylabProcedure):
                 self.amplitude_voltage,
                 self.points_per_decade,
                 "PEIS",
-                lambda: furnace.finished,
+                partial(attrgetter("finished"), furnace),
             )
             self.active_instruments.append(potentiostat)
         if self.po2_toggle:
@@ -11,13 +11,16 @@ python s8_gui.py
 """
 
 import sys
+from functools import partial
+from operator import attrgetter
 from typing import Dict, List
 
 # Instrument Imports #
 from nupylab.instruments.ac_potentiostat.biologic import Biologic as Potentiostat
 from nupylab.instruments.heater.eurotherm2200 import Eurotherm2200 as Heater
 ######################
-from nupylab.utilities import list_resources, nupylab_procedure, nupylab_window
+from nupylab.utilities import nupylab_procedure, nupylab_window
+from nupylab.utilities.nupylab_procedure import ResourceListParameter
 from pymeasure.display.Qt import QtWidgets
 from pymeasure.experiment import (
     BooleanParameter,
@@ -36,10 +39,8 @@ class S8Procedure(nupylab_procedure.NupylabProcedure):
     `num_steps`, and `current_steps` from parent class.
     """
 
-    resources = list_resources()
-
-    furnace_port: ListParameter = ListParameter(
-        "Eurotherm Port", choices=resources, ui_class=None
+    furnace_port: ListParameter = ResourceListParameter(
+        "Eurotherm Port", ui_class=None
     )
     furnace_address: IntegerParameter = IntegerParameter(
         "Eurotherm Address", minimum=1, maximum=254, step=1, default=1
@@ -57,8 +58,6 @@ class S8Procedure(nupylab_procedure.NupylabProcedure):
     amplitude_voltage: FloatParameter = FloatParameter("Amplitude Voltage", units="V")
     points_per_decade: IntegerParameter = IntegerParameter("Points Per Decade")
 
-    # Units in parentheses must be valid pint units
-    # First two entries must be "System Time" and "Time (s)"
     DATA_COLUMNS: List[str] = [
         "System Time",
         "Time (s)",
@@ -133,7 +132,7 @@ class S8Procedure(nupylab_procedure.NupylabProcedure):
                 self.amplitude_voltage,
                 self.points_per_decade,
                 "PEIS",
-                lambda: furnace.finished,
+                partial(attrgetter("finished"), furnace),
             )
         else:
             self.active_instruments = (furnace,)
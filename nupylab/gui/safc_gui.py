@@ -14,6 +14,8 @@ python safc_gui.py
 """
 
 import sys
+from functools import partial
+from operator import attrgetter
 from typing import Dict, List
 
 # Instrument Imports #
@@ -25,13 +27,13 @@ from nupylab.instruments.mfc.rod4 import ROD4 as MFC
 from nupylab.instruments.scanner.keithley705 import Keithley705 as Scanner
 from nupylab.instruments.thermocouple_sensor.hp3478A import HP3478A as TC_Sensor
 ######################
-from nupylab.utilities import list_resources, nupylab_procedure, nupylab_window
+from nupylab.utilities import nupylab_procedure, nupylab_window
+from nupylab.utilities.nupylab_procedure import ResourceListParameter
 from pymeasure.display.Qt import QtWidgets
 from pymeasure.experiment import (
     BooleanParameter,
     FloatParameter,
     IntegerParameter,
-    ListParameter,
 )
 
 
@@ -60,18 +62,14 @@ class SAFCProcedure(nupylab_procedure.NupylabProcedure):
         "-Z_im (ohm)",
     ]
 
-    resources = list_resources()
-
-    furnace_port = ListParameter("Eurotherm Port", choices=resources, ui_class=None)
+    furnace_port = ResourceListParameter("Eurotherm Port", ui_class=None)
     furnace_address = IntegerParameter(
         "Eurotherm Address", minimum=1, maximum=254, step=1, default=1
     )
-    mfc_port = ListParameter("ROD-4 Port", choices=resources, ui_class=None)
-    potentiostat_port = ListParameter(
-        "Potentiostat Port", choices=resources, ui_class=None
-    )
-    tc_sensor_port = ListParameter("TC Sensor Port", choices=resources, ui_class=None)
-    scanner_port = ListParameter("Scanner Port", choices=resources, ui_class=None)
+    mfc_port = ResourceListParameter("ROD-4 Port", ui_class=None)
+    potentiostat_port = ResourceListParameter("Potentiostat Port", ui_class=None)
+    tc_sensor_port = ResourceListParameter("TC Sensor Port", ui_class=None)
+    scanner_port = ResourceListParameter("Scanner Port", ui_class=None)
 
     target_temperature = FloatParameter("Target Temperature", units="C")
     ramp_rate = FloatParameter("Ramp Rate", units="C/min")
@@ -185,7 +183,7 @@ class SAFCProcedure(nupylab_procedure.NupylabProcedure):
                 self.amplitude_voltage,
                 self.points_per_decade,
                 "PEIS",
-                lambda: furnace.finished,
+                partial(attrgetter("finished"), furnace),
             )
             # EIS channels are 10 + TC channels, and channel 1 is internal cj voltage
             scanner.set_parameters(
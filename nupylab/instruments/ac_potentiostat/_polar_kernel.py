@@ -0,0 +1,44 @@
+"""Polar to rectangular impedance conversion, JIT-compiled if Numba is installed."""
+
+import math
+
+import numpy as np
+
+try:
+    from numba import njit
+
+    GOT_NUMBA = True
+except ImportError:
+    GOT_NUMBA = False
+
+
+def _polar_to_rect_numpy(
+    abs_z: np.ndarray, phase: np.ndarray, re: np.ndarray, neg_im: np.ndarray
+) -> None:
+    """Convert impedance magnitude and phase to Z_re and -Z_im in place.
+
+    Args:
+        abs_z: impedance magnitude.
+        phase: impedance phase in radians.
+        re: output buffer for Z_re, same size as `abs_z`.
+        neg_im: output buffer for -Z_im, same size as `abs_z`.
+    """
+    np.multiply(abs_z, np.cos(phase), out=re)
+    np.multiply(abs_z, np.sin(phase), out=neg_im)
+    np.negative(neg_im, out=neg_im)
+
+
+if GOT_NUMBA:
+
+    @njit(cache=True)
+    def _polar_to_rect_numba(abs_z, phase, re, neg_im):
+        """Compiled equivalent of :func:`_polar_to_rect_numpy`."""
+        for i in range(abs_z.size):
+            s = math.sin(phase[i])
+            c = math.cos(phase[i])
+            re[i] = abs_z[i] * c
+            neg_im[i] = -abs_z[i] * s
+
+    polar_to_rect = _polar_to_rect_numba
+else:
+    polar_to_rect = _polar_to_rect_numpy
@@ -1,13 +1,24 @@
 """Adapts Agilent 4284A driver to NUPylab instrument class for use with NUPyLab GUIs."""
 
-from typing import Sequence, List, Optional, Callable
+import math
+from enum import Enum
+from typing import Sequence, List, Optional, Callable, Iterator, Tuple
 
 import numpy as np
-from pymeasure.instruments.agilent import agilent4284A
+from nupylab.drivers import agilent4284A
+from nupylab.instruments.ac_potentiostat._polar_kernel import polar_to_rect
 from nupylab.utilities import DataTuple, NupylabError
 from nupylab.utilities.nupylab_instrument import NupylabInstrument
 
 
+class _State(Enum):
+    """EIS measurement state."""
+
+    WAITING = 0  # Waiting on external condition to begin measurement
+    ACTIVE = 1  # Condition met, measurement in progress
+    DONE = 2  # Measurement finished
+
+
 class Agilent4284A(NupylabInstrument):
     """Agilent 4284A instrument class. Abstracts driver for NUPyLab procedures.
 
@@ -18,6 +29,9 @@ class Agilent4284A(NupylabInstrument):
         agilent: Agilent 4284A driver class.
     """
 
+    # Driver `configure` keyword setting the AC amplitude for each technique
+    _AMPLITUDE_KWARGS = {"PEIS": "voltage", "GEIS": "current"}
+
     def __init__(
         self,
         port: str,
@@ -40,15 +54,21 @@ class Agilent4284A(NupylabInstrument):
             raise ValueError("Agilent 4284A data_label must be sequence of length 3.")
         self.agilent = None
         self._port = port
-        self._finished: bool = False
+        self._state: _State = _State.WAITING
         self._freq_list = None
+        self._freq_key = None
+        self._z_re_buf: Optional[np.ndarray] = None
+        self._neg_z_im_buf: Optional[np.ndarray] = None
+        self._sweep: Optional[Iterator[Tuple[list, list, list]]] = None
         self._eis_condition = None
+        self._last_cfg: Optional[Tuple[str, float]] = None
         super().__init__(data_label, name)
 
     def connect(self) -> None:
         """Connect to Agilent 4284A."""
         with self.lock:
             self.agilent = agilent4284A.Agilent4284A(self._port)
+            self._last_cfg = None
             self._connected = True
 
     def set_parameters(
@@ -75,21 +95,42 @@ class Agilent4284A(NupylabInstrument):
             KeyError: if `technique` is not supported.
         """
         technique = technique.upper()
-        if technique not in ("PEIS", "GEIS"):
+        if technique not in self._AMPLITUDE_KWARGS:
             raise KeyError(f"Technique {technique} must be `PEIS` or `GEIS`.")
+        cfg = (technique, amplitude)
+        settings = {self._AMPLITUDE_KWARGS[technique]: amplitude}
+        # Lock only instrument writes. Only reset on first configuration, afterward
+        # send changed settings.
         with self.lock:
-            self.agilent.clear()
-            self.agilent.reset()
-            if technique == "PEIS":
-                self.agilent.ac_voltage = amplitude
-            else:
-                self.agilent.ac_current = amplitude
-            self.agilent.mode = "ZTR"
-        self._finished = False
-        max_f_log = np.log10(maximum_frequency)
-        min_f_log = np.log10(minimum_frequency)
+            if self._last_cfg is None:
+                self.agilent.clear()
+                self.agilent.reset()
+                self.agilent.configure(mode="ZTR", **settings)
+            elif cfg != self._last_cfg:
+                self.agilent.configure(**settings)
+            self._last_cfg = cfg
+        self._state = _State.WAITING
+        max_f_log = math.log10(maximum_frequency)
+        min_f_log = math.log10(minimum_frequency)
         freq_steps: int = round((max_f_log - min_f_log) * points_per_decade) + 1
-        self._freq_list = np.logspace(max_f_log, min_f_log, num=freq_steps)
+        freq_key = (max_f_log, min_f_log, freq_steps)
+        if freq_key != self._freq_key:  # Reuse frequency list if unchanged
+            # Geometric sequence by running product, avoids a pow() per point
+            ratio = (
+                (minimum_frequency / maximum_frequency) ** (1 / (freq_steps - 1))
+                if freq_steps > 1
+                else 1.0
+            )
+            freq_list = np.full(freq_steps, ratio)
+            freq_list[0] = maximum_frequency
+            np.cumprod(freq_list, out=freq_list)
+            if freq_steps > 1:
+                freq_list[-1] = minimum_frequency
+            self._freq_list = freq_list.astype(np.float32)
+            self._freq_key = freq_key
+            # Impedance output buffers are filled in place by each sweep
+            self._z_re_buf = np.empty(freq_steps, dtype=np.float64)
+            self._neg_z_im_buf = np.empty(freq_steps, dtype=np.float64)
         self._eis_condition = eis_condition
         self._parameters = True  # Placeholder just to indicate parameters are set.
 
@@ -109,39 +150,68 @@ class Agilent4284A(NupylabInstrument):
     def get_data(self) -> Optional[List[DataTuple]]:
         """Get eis data.
 
+        The whole sweep is measured back-to-back in one call. Each block of
+        frequencies is converted into the impedance buffers as it arrives.
+
         Returns:
             DataTuples in the order of frequency, Z_re, and -Z_im if measuring eis,
             None otherwise
         """
-        if not self.eis_condition:
-            return
-        with self.lock:
-            results = self.agilent.sweep_measurement("frequency", self._freq_list)
-        abs_z, z_phase, freq = results
-        z_re = abs_z * np.cos(z_phase)
-        z_im = abs_z * np.sin(z_phase)
-        data = [
+        if self._state is _State.WAITING and self._eis_condition():
+            self._state = _State.ACTIVE
+        if self._state is not _State.ACTIVE:
+            return None
+        # Generator does not communicate with instrument until first advanced
+        self._sweep = self.agilent.iter_sweep_measurement("frequency", self._freq_list)
+        freq: List[float] = []
+        stop = 0
+        while True:
+            # Lock per block, so that the sweep can be stopped between blocks
+            with self.lock:
+                if self._sweep is None:  # Stopped
+                    break
+                results = next(self._sweep, None)
+            if results is None:
+                break
+            abs_z, z_phase, block_freq = results
+            start = stop
+            stop = start + len(abs_z)
+            polar_to_rect(
+                np.asarray(abs_z),
+                np.asarray(z_phase),
+                self._z_re_buf[start:stop],
+                self._neg_z_im_buf[start:stop],
+            )
+            freq.extend(block_freq)
+        self._sweep = None
+        self._state = _State.DONE
+        return [
             DataTuple(self.data_label[0], freq),
-            DataTuple(self.data_label[1], z_re),
-            DataTuple(self.data_label[2], -z_im),
+            DataTuple(self.data_label[1], self._z_re_buf[:stop]),
+            DataTuple(self.data_label[2], self._neg_z_im_buf[:stop]),
         ]
-        self._finished = True
-        return data
 
     @property
     def eis_condition(self) -> bool:
-        """Get whether to begin eis measurement."""
-        if self.finished:  # Prevents unnecessary function calls
-            return False
-        return self._eis_condition()
+        """Get whether to begin eis measurement, or whether it is in progress."""
+        # External condition is only evaluated while waiting to begin measurement
+        if self._state is _State.WAITING:
+            return self._eis_condition()
+        return self._state is _State.ACTIVE
 
     @property
     def finished(self) -> bool:
         """Get whether eis measurement is finished."""
-        return self._finished
+        return self._state is _State.DONE
 
     def stop_measurement(self) -> None:
-        """Stop eis measurement. Not implemented."""
+        """Stop eis measurement, abandoning any partially completed sweep."""
+        with self.lock:
+            if self._sweep is not None:
+                self._sweep.close()
+                self._sweep = None
+            if self._state is _State.ACTIVE:
+                self._state = _State.DONE
 
     def shutdown(self) -> None:
         """Disconnect from Agilent 4284A."""
@@ -1,17 +1,31 @@
 """Adapts Biologic driver to NUPylab instrument class for use with NUPyLab GUIs."""
 from __future__ import annotations
-import importlib
-from typing import Sequence, Union, TYPE_CHECKING, Optional, List, Type, Callable
+from ctypes import c_uint8
+from enum import Enum
+from math import log10
+from types import MappingProxyType
+from typing import (
+    Callable, Dict, List, Optional, Sequence, TYPE_CHECKING, Type, Union
+)
 
 import numpy as np
-from nupylab.drivers.biologic import BiologicPotentiostat, OCV
+from nupylab.drivers.biologic import BiologicPotentiostat, GEIS, OCV, PEIS, SGEIS, SPEIS
 from nupylab.utilities import DataTuple, NupylabError
 from nupylab.utilities.nupylab_instrument import NupylabInstrument
 
 if TYPE_CHECKING:
+    from ctypes import Array
     from nupylab.drivers.biologic import Technique
 
 
+class _Phase(Enum):
+    """Biologic measurement phase."""
+
+    IDLE = 0  # Measurement not started
+    OCV = 1  # Measuring OCV, waiting on external condition to begin eis
+    EIS = 2  # Measuring eis
+
+
 class Biologic(NupylabInstrument):
     """Biologic instrument class. Abstracts driver for NUPyLab procedures.
 
@@ -52,28 +66,40 @@ class Biologic(NupylabInstrument):
             channels = (channels,)
         if len(channels) * 4 != len(data_label):
             raise ValueError("data_label must contain 4 entries per channel.")
-        model = model.replace("-", "").replace(" ", "").upper()
         self.biologic: BiologicPotentiostat = BiologicPotentiostat(
             model, port, eclib_path
         )
         self.ocv = None
-        self.channels = channels
-        self._chan_bool: List[int] = [
-            0,
-        ] * 16  # for multi-channel operations
+        self._ocv_cache: Dict[float, OCV] = {}  # OCV techniques by record time
+        self.channels = tuple(channels)
+        # Channel selection for multi-channel operations, preconverted for EClib
+        self._chan_bool: Array[c_uint8] = (c_uint8 * 16)()
         for c in self.channels:
             self._chan_bool[c] = 1
-        self._measuring_ocv: bool = False
+        self._phase: _Phase = _Phase.IDLE
         self._finished: bool = False
         self._eis_condition = None
         super().__init__(data_label, name)
 
     def connect(self) -> None:
-        """Connect to Biologic."""
-        with self.lock:
+        """Connect to Biologic, if not already connected.
+
+        EClib only loads firmware on channels that do not already have it, so
+        reconnecting is fast, and a power-cycled instrument gets its firmware back.
+
+        Raises:
+            NupylabError: if instrument lock cannot be acquired within 5 seconds.
+        """
+        if self._connected:
+            return
+        if not self.lock.acquire(timeout=5.0):
+            raise NupylabError(f"Timed out waiting to connect to {self.name}.")
+        try:
             self.biologic.connect()
-            self.biologic.load_firmware(self._chan_bool)
+            self.biologic.load_firmware(self._chan_bool, force_reload=False)
             self._connected = True
+        finally:
+            self.lock.release()
 
     def _initialize_eis(
         self,
@@ -86,8 +112,8 @@ class Biologic(NupylabInstrument):
         eis: Type[Technique],
         **kwargs,
     ) -> None:
-        freq_steps: int = round((np.log10(max_freq) - np.log10(min_freq)) * ppd) + 1
-        technique_dict: dict = globals()[technique + "_DICT"].copy()
+        freq_steps: int = round(log10(max_freq / min_freq) * ppd) + 1
+        technique_dict: dict = _TECHNIQUE_DICTS[technique].copy()
         technique_dict.update(
             {
                 "initial_frequency": max_freq,
@@ -96,16 +122,17 @@ class Biologic(NupylabInstrument):
                 "record_every_dt": record_time
             }
         )
-        if technique in ("PEIS" or "SPEIS"):
+        if technique in _VOLTAGE_TECHNIQUES:
             technique_dict.update({"amplitude_voltage": amp})
         else:
             technique_dict.update({"amplitude_current": amp})
-        for key in kwargs.keys():
-            if key not in technique_dict:
-                raise KeyError(
-                    f"Biologic technique {technique} does not contain "
-                    f"keyword argument {key}"
-                )
+        unknown = kwargs.keys() - technique_dict.keys()
+        if unknown:
+            raise KeyError(
+                f"Biologic technique {technique} does not contain "
+                f"keyword argument(s) {', '.join(sorted(unknown))}"
+            )
+        technique_dict.update(kwargs)
         self._eis = eis(**technique_dict)
 
     def set_parameters(
@@ -137,19 +164,21 @@ class Biologic(NupylabInstrument):
             KeyError: if `technique` is not supported.
         """
         technique = technique.upper()
-        if technique not in ("PEIS", "GEIS", "SPEIS", "SGEIS"):
+        if technique not in _VALID_TECHNIQUES:
             raise KeyError(
                 f"Technique {technique} must be `PEIS`, `GEIS`, `SPEIS`, or `SGEIS`."
             )
-        eis: Type[Technique] = getattr(
-            importlib.import_module("nupylab.drivers.biologic"), technique
-        )
-        self.ocv: OCV = OCV(
-            duration=24 * 60 * 60,
-            record_every_de=0.1,
-            record_every_dt=record_time,
-            e_range="KBIO_ERANGE_AUTO",
-        )
+        eis: Type[Technique] = _TECHNIQUE_CLASSES[technique]
+        ocv = self._ocv_cache.get(record_time)
+        if ocv is None:
+            ocv = OCV(
+                duration=24 * 60 * 60,
+                record_every_de=0.1,
+                record_every_dt=record_time,
+                e_range="KBIO_ERANGE_AUTO",
+            )
+            self._ocv_cache[record_time] = ocv
+        self.ocv: OCV = ocv
         self._eis_condition = eis_condition
         self._initialize_eis(
             maximum_frequency,
@@ -176,13 +205,16 @@ class Biologic(NupylabInstrument):
                 "must be called before calling its `start` method."
             )
         with self.lock:
-            for c in self.channels:
-                self.biologic.load_technique(c, self.ocv, first=True, last=True)
             if len(self.channels) == 1:
-                self.biologic.start_channel(self.channels[0])
+                channel = self.channels[0]
+                self.biologic.load_technique(channel, self.ocv, first=True, last=True)
+                self.biologic.start_channel(channel)
             else:
+                self.biologic.load_technique_channels(
+                    self._chan_bool, self.ocv, first=True, last=True
+                )
                 self.biologic.start_channels(self._chan_bool)
-        self._measuring_ocv = True
+        self._phase = _Phase.OCV
         self._parameters = None
 
     def get_data(self) -> List[DataTuple]:
@@ -193,13 +225,13 @@ class Biologic(NupylabInstrument):
             channel if measuring eis, E_we only if measuring OCV.
         """
         with self.lock:
-            all_data = [self.biologic.get_data(c) for c in self.channels]
-            if not self._measuring_ocv:
-                self._finished = all(
-                    self.biologic.get_channel_infos(c)["State"] == 0 for c in self.channels
-                )
-            # Switch from OCV to eis upon external condition, like furnace program complete
-            if self.eis_condition:
+            all_data = self.biologic.get_data_multi(self.channels)
+            if self._phase is not _Phase.OCV:
+                get_state = self.biologic.get_channel_state
+                self._finished = all(get_state(c) == 0 for c in self.channels)
+            # Switch from OCV to eis upon external condition, like furnace program
+            # complete. Condition is only evaluated until eis has started.
+            if self._phase is _Phase.OCV and self._eis_condition():
                 if len(self.channels) == 1:
                     channel = self.channels[0]
                     self.biologic.stop_channel(channel)
@@ -207,42 +239,44 @@ class Biologic(NupylabInstrument):
                     self.biologic.start_channel(channel)
                 else:
                     self.biologic.stop_channels(self._chan_bool)
-                    for c in self.channels:
-                        self.biologic.load_technique(c, self._eis, first=True, last=True)
+                    self.biologic.load_technique_channels(
+                        self._chan_bool, self._eis, first=True, last=True
+                    )
                     self.biologic.start_channels(self._chan_bool)
-                self._measuring_ocv = False
+                self._phase = _Phase.EIS
 
         data = []
+        label = self.data_label
         for kbio_data, c in zip(all_data, self.channels):
             if kbio_data is None:
                 continue
 
             if "freq" in kbio_data.data_field_names:  # Measuring PEIS
-                abs_z = kbio_data.abs_Ewe_numpy / kbio_data.abs_I_numpy
-                z_phase = kbio_data.Phase_Zwe_numpy
+                abs_z = kbio_data.get_numpy("abs_Ewe") / kbio_data.get_numpy("abs_I")
+                z_phase = kbio_data.get_numpy("Phase_Zwe")
                 z_re = abs_z * np.cos(z_phase)
-                z_im = abs_z * np.sin(z_phase)
+                neg_z_im = -abs_z * np.sin(z_phase)
                 data.append((
-                    DataTuple(self.data_label[0], kbio_data.Ewe),
-                    DataTuple(self.data_label[1], kbio_data.freq),
-                    DataTuple(self.data_label[2], z_re),
-                    DataTuple(self.data_label[3], -z_im),)
+                    DataTuple(label[0], kbio_data.Ewe),
+                    DataTuple(label[1], kbio_data.freq),
+                    DataTuple(label[2], z_re),
+                    DataTuple(label[3], neg_z_im),)
                 )
             else:
-                data.append(DataTuple(self.data_label[0], kbio_data.Ewe))
+                data.append(DataTuple(label[0], kbio_data.Ewe))
         return data
 
     @property
     def eis_condition(self) -> bool:
         """Get whether to begin eis measurement."""
-        if not self._measuring_ocv:  # Prevents unnecessary function calls
+        if self._phase is not _Phase.OCV:  # Prevents unnecessary function calls
             return False
         return self._eis_condition()
 
     @property
     def finished(self) -> bool:
         """Get whether Biologic channels are finished."""
-        if self._measuring_ocv:  # Never finished if measuring OCV
+        if self._phase is _Phase.OCV:  # Never finished if measuring OCV
             return False
         return self._finished
 
@@ -258,9 +292,10 @@ class Biologic(NupylabInstrument):
         """Disconnect from Biologic."""
         with self.lock:
             self.biologic.disconnect()
+            self._connected = False
 
 
-PEIS_DICT = {
+PEIS_DICT = MappingProxyType({
     "initial_voltage_step": 0,
     "duration_step": 5.0,
     "vs_initial": False,
@@ -277,9 +312,9 @@ PEIS_DICT = {
     "i_range": "KBIO_IRANGE_AUTO",
     "e_range": "KBIO_ERANGE_2_5",
     "bandwidth": "KBIO_BW_5",
-}
+})
 
-SPEIS_DICT = {
+SPEIS_DICT = MappingProxyType({
     "initial_voltage_step": 0.0,
     "duration_step": 10.0,
     "final_voltage_step": 0.1,
@@ -298,9 +333,9 @@ SPEIS_DICT = {
     "i_range": "KBIO_IRANGE_AUTO",
     "e_range": "KBIO_ERANGE_2_5",
     "bandwidth": "KBIO_BW_5",
-}
+})
 
-GEIS_DICT = {
+GEIS_DICT = MappingProxyType({
     "initial_current_step": 0.0,
     "duration_step": 5.0,
     "vs_initial": False,
@@ -317,9 +352,9 @@ GEIS_DICT = {
     "i_range": "KBIO_IRANGE_1mA",
     "e_range": "KBIO_ERANGE_AUTO",
     "bandwidth": "KBIO_BW_5",
-}
+})
 
-SGEIS_DICT = {
+SGEIS_DICT = MappingProxyType({
     "initial_current_step": 0.0,
     "duration_step": 10.0,
     "final_current_step": 0.1,
@@ -338,4 +373,22 @@ SGEIS_DICT = {
     "i_range": "KBIO_IRANGE_1mA",
     "e_range": "KBIO_ERANGE_AUTO",
     "bandwidth": "KBIO_BW_5",
+})
+
+# Default arguments and driver class for each supported eis technique
+_TECHNIQUE_DICTS = {
+    "PEIS": PEIS_DICT,
+    "SPEIS": SPEIS_DICT,
+    "GEIS": GEIS_DICT,
+    "SGEIS": SGEIS_DICT,
 }
+
+_TECHNIQUE_CLASSES = {
+    "PEIS": PEIS,
+    "SPEIS": SPEIS,
+    "GEIS": GEIS,
+    "SGEIS": SGEIS,
+}
+
+_VALID_TECHNIQUES = frozenset(_TECHNIQUE_CLASSES)
+_VOLTAGE_TECHNIQUES = frozenset({"PEIS", "SPEIS"})
@@ -1,5 +1,6 @@
 import sys
-from typing import NamedTuple, Sequence, Tuple, Union
+from functools import lru_cache
+from typing import NamedTuple, Optional, Sequence, Tuple, Union
 
 import pyvisa
 
@@ -15,9 +16,34 @@ class NupylabError(Exception):
     """General exception class for errors in NUPyLab library."""
 
 
+@lru_cache(maxsize=None)
+def get_resource_manager(backend: Optional[str] = None) -> pyvisa.ResourceManager:
+    """Get PyVISA resource manager, created once per backend for the Python process.
+
+    Args:
+        backend: PyVISA backend, e.g. `@ivi` or `@py`. Optional, defaults to PyVISA
+            default.
+
+    Returns:
+        PyVISA resource manager.
+    """
+    if backend is not None:
+        return pyvisa.ResourceManager(backend)
+    return pyvisa.ResourceManager()
+
+
+@lru_cache(maxsize=8)
 def list_resources(query: str = "?*::INSTR", backend: str = None) -> Tuple[str, ...]:
     """Get PyVISA resource manager list. Provided for compatibility with Sphinx.
 
+    Results are cached for the lifetime of the Python process, since resource discovery
+    can be slow on some VISA backends. Call :func:`refresh_resources` to rescan.
+
+    By default, resources are listed with the PyVISA default backend, which the
+    drivers also open their ports with: an IVI library such as NI-VISA if one is
+    installed, and pyvisa-py otherwise. Listed names are therefore valid for the
+    drivers.
+
     Args:
         query: VISA Resource Regular Expression syntax for finding devices.
         backend: PyVISA backend, e.g. `@ivi` or `@py`. Optional, defaults to PyVISA
@@ -26,10 +52,11 @@ def list_resources(query: str = "?*::INSTR", backend: str = None) -> Tuple[str,
     Returns:
         Tuple of PyVISA resources.
     """
-    if "sphinx" not in sys.modules:
-        if backend is not None:
-            rm = pyvisa.ResourceManager(backend)
-        else:
-            rm = pyvisa.ResourceManager()
-        return rm.list_resources(query)
-    return ()
+    if "sphinx" in sys.modules:
+        return ()
+    return get_resource_manager(backend).list_resources(query)
+
+
+def refresh_resources() -> None:
+    """Clear cached results of :func:`list_resources` so the next call rescans."""
+    list_resources.cache_clear()
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from math import nan
 from queue import Empty, SimpleQueue
@@ -10,8 +11,14 @@ from threading import Thread
 from time import monotonic, sleep
 from typing import Callable, Dict, List, Optional, Sequence, TYPE_CHECKING, Union
 
-from nupylab.utilities import DataTuple, NupylabError
-from pymeasure.experiment import FloatParameter, IntegerParameter, Procedure
+from nupylab.utilities import DataTuple, NupylabError, list_resources
+from pymeasure.experiment import (
+    FloatParameter,
+    IntegerParameter,
+    ListParameter,
+    Parameter,
+    Procedure,
+)
 
 if TYPE_CHECKING:
     from nupylab.utilities.nupylab_instrument import NupylabInstrument
@@ -21,6 +28,55 @@ log = logging.getLogger(__name__)
 log.addHandler(logging.NullHandler())
 
 
+class ResourceListParameter(ListParameter):
+    """ListParameter with PyVISA resources as choices.
+
+    Resources are discovered the first time the choices are needed, e.g. when the GUI
+    builds its inputs, rather than when the procedure class is defined. The scan is
+    cached by :func:`~nupylab.utilities.list_resources`, so choices follow
+    :func:`~nupylab.utilities.refresh_resources`.
+
+    Resources are listed with the PyVISA default backend unless `backend` is given.
+    This is the backend the drivers open their ports with: IVI if an IVI library is
+    installed, and pyvisa-py otherwise. A different backend may list names that the
+    drivers cannot open.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        query: str = "?*::INSTR",
+        backend: Optional[str] = None,
+        **kwargs,
+    ) -> None:
+        """Initialize parameter without discovering resources.
+
+        Args:
+            name: the parameter name.
+            query: VISA Resource Regular Expression syntax for finding devices.
+            backend: PyVISA backend, e.g. `@ivi` or `@py`. Optional, defaults to
+                PyVISA default.
+            **kwargs: optional keyword arguments passed to
+                :class:`pymeasure.experiment.ListParameter`.
+        """
+        self._query: str = query
+        self._backend: Optional[str] = backend
+        self._explicit_choices: Optional[dict] = None
+        super().__init__(name, choices=None, **kwargs)
+
+    @property
+    def _choices(self) -> dict:
+        if self._explicit_choices is not None:
+            return self._explicit_choices
+        # list_resources caches the scan, and refresh_resources clears that cache
+        resources = list_resources(self._query, self._backend)
+        return {str(r): r for r in resources}
+
+    @_choices.setter
+    def _choices(self, choices: Optional[dict]) -> None:
+        self._explicit_choices = choices
+
+
 class NupylabProcedure(Procedure):
     """Base Procedure for NUPyLab GUI procedures to subclass.
 
@@ -55,6 +111,7 @@ class NupylabProcedure(Procedure):
         self.previous_procedure: Optional[NupylabProcedure] = None
         self.instruments: Sequence[NupylabInstrument] = ()
         self.active_instruments: Sequence[NupylabInstrument] = ()
+        self._emit_results: Callable[[List[SimpleQueue]], int] = self._emit_results_full
 
         super().__init__()
 
@@ -71,6 +128,12 @@ class NupylabProcedure(Procedure):
                 "Attribute `TABLE_PARAMETERS` must be overridden by child class "
                 f"`{self.__class__.__name__}`."
             )
+        for parameter in self.TABLE_PARAMETERS.values():
+            # Check the class, since instance attributes are set from the table
+            if not isinstance(getattr(type(self), parameter, None), Parameter):
+                raise AttributeError(f"`TABLE_PARAMETERS` entry `{parameter}` does "
+                                     "not name any defined parameters.")
+
         if hasattr(self, "X_AXIS"):
             for x in self.X_AXIS:
                 if x not in self.DATA_COLUMNS:
@@ -107,16 +170,30 @@ class NupylabProcedure(Procedure):
         if not self.instruments or not self.active_instruments:
             raise NupylabError("Method `set_instruments` must create non-empty "
                                "`instruments` and `active_instruments` attributes.")
+        # Connect concurrently so instrument handshakes overlap
+        pending = [i for i in self.active_instruments if not i.connected]
+        if pending:
+            with ThreadPoolExecutor(max_workers=len(pending)) as executor:
+                futures = {executor.submit(i.connect): i for i in pending}
+                for future in as_completed(futures):
+                    future.result()  # Raise any connection errors
+                    log.info("Connection to %s successful.", futures[future].name)
         for instrument in self.active_instruments:
-            if not instrument.connected:
-                instrument.connect()
-                log.info("Connection to %s successful.", instrument.name)
             instrument.start()
+        # Only EIS measurements produce multi-valued results
+        if getattr(self, "eis_toggle", True):
+            self._emit_results = self._emit_results_full
+        else:
+            self._emit_results = self._emit_results_scalar_only
         self.previous_procedure = None  # Prevent procedure-chaining in memory
         sleep(1)  # give instruments time to start their respective programs
 
     def execute(self) -> None:
-        """Loop through thread for each instrument and emit results."""
+        """Loop through thread for each instrument and emit results.
+
+        Each active instrument is read in its own thread, so blocking instrument I/O,
+        e.g. a long impedance sweep, does not delay reads of the other instruments.
+        """
         log.info("Running step %d / %d.", self.current_step, self.num_steps)
         queues = []
         threads = []
@@ -218,8 +295,61 @@ class NupylabProcedure(Procedure):
         else:
             self._multivalue_results.append(result)
 
-    def _emit_results(self, queues: List[SimpleQueue]) -> int:
-        """Emit next set of results from all queues.
+    def _parse_scalar_results(self, result: Union[list, tuple]) -> None:
+        """Write single-valued results to class data.
+
+        Raises:
+            NupylabError: if a result has more than one value.
+        """
+        # Recursively unpack if necessary
+        if not isinstance(result, DataTuple):
+            for r in result:
+                self._parse_scalar_results(r)
+            return
+        if not hasattr(result.value, "__len__"):
+            self._data[result.label] = result.value
+        elif len(result.value) == 1:
+            self._data[result.label] = result.value[0]
+        elif len(result.value) > 1:
+            raise NupylabError(
+                f"Result {result.label} has multiple values, but no active instrument "
+                f"reported multi-valued results."
+            )
+
+    def _emit_results_scalar_only(self, queues: List[SimpleQueue]) -> int:
+        """Emit next set of single-valued results from all queues.
+
+        Used in place of :meth:`_emit_results_full` when no active instrument returns
+        multi-valued results, e.g. for steps without EIS.
+
+        Args:
+            queues: list of queues.
+
+        Returns:
+            the number of queues that contained results.
+        """
+        filled_queues: int = 0
+        results: tuple
+        for q in queues:
+            try:
+                results = q.get_nowait()
+                filled_queues += 1
+            except Empty:
+                continue
+            self._parse_scalar_results(results)
+
+        if filled_queues == 0:
+            return filled_queues
+
+        self._data["Time (s)"] = self.record_time * (self._counter - 1)
+        self._data["System Time"] = str(datetime.now())
+        self.emit("results", self._data)
+        self.emit("progress", self.progress)
+        self._data.update(self._data_defaults)  # reset data to defaults
+        return filled_queues
+
+    def _emit_results_full(self, queues: List[SimpleQueue]) -> int:
+        """Emit next set of results from all queues, expanding multi-valued results.
 
         Args:
             queues: list of queues.
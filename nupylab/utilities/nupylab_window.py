@@ -52,9 +52,9 @@ class NupylabWindow(ManagedDockWindow):
         """
         kwargs.setdefault("linewidth", 2)
         if hasattr(procedure_class, "X_AXIS"):
-            kwargs.setdefault("x_axis", procedure_class.X_AXIS)
+            kwargs.setdefault("x_axis", list(procedure_class.X_AXIS))
         if hasattr(procedure_class, "Y_AXIS"):
-            kwargs.setdefault("y_axis", procedure_class.Y_AXIS)
+            kwargs.setdefault("y_axis", list(procedure_class.Y_AXIS))
         if hasattr(procedure_class, "INPUTS"):
             kwargs.setdefault("inputs", procedure_class.INPUTS)
         table_column_labels = list(procedure_class.TABLE_PARAMETERS)
@@ -128,18 +128,23 @@ class NupylabWindow(ManagedDockWindow):
         converted_df: pd.DataFrame = self.verify_parameters(table_df)
 
         num_steps: int = converted_df.shape[0]
-        current_step: int = 1
         previous_procedure = None
+        # Extract each column once and index by step, rather than building row tuples
+        columns: Dict[str, list] = {
+            parameter: converted_df[column].tolist()
+            for parameter, column in zip(
+                self.procedure_class.TABLE_PARAMETERS.values(), converted_df.columns
+            )
+        }
 
-        for table_row in converted_df.itertuples(index=False):
+        for step in range(num_steps):
             procedure: NupylabProcedure = self.make_procedure()
             procedure.num_steps = num_steps
-            procedure.current_step = current_step
-            for i, parameter in enumerate(procedure.TABLE_PARAMETERS.values()):
-                setattr(procedure, parameter, table_row[i])
+            procedure.current_step = step + 1
+            for parameter, values in columns.items():
+                setattr(procedure, parameter, values[step])
             procedure.refresh_parameters()
             procedure.previous_procedure = previous_procedure
-            current_step += 1
             filename: str = unique_filename(
                 self.directory,
                 prefix=self.file_input.filename_base + "_",
@@ -0,0 +1,60 @@
+"""Tests for data parsing of the Biologic driver."""
+
+from types import SimpleNamespace
+
+import pytest
+
+biologic = pytest.importorskip("nupylab.drivers.biologic")
+
+
+@pytest.mark.parametrize("got_numpy", [True, False])
+@pytest.mark.parametrize("technique_id, process", [(100, 0), (104, 0), (104, 1)])
+@pytest.mark.parametrize("number_of_columns", [0, 4])
+def test_empty_read(monkeypatch, got_numpy, technique_id, process, number_of_columns):
+    """A read without points gives empty fields instead of raising."""
+    monkeypatch.setattr(biologic, "GOT_NUMPY", got_numpy)
+    data_infos = biologic.DataInfos()
+    data_infos.TechniqueID = technique_id
+    data_infos.ProcessIndex = process
+    data_infos.NbRows = 0
+    data_infos.NbCols = number_of_columns
+    current_values = biologic.CurrentValues()
+    current_values.TimeBase = 2.5e-5
+    instrument = SimpleNamespace(series="vmp3")
+
+    data = biologic.KBIOData(
+        (biologic.c_uint32 * 1000)(), data_infos, current_values, instrument
+    )
+
+    names = data.data_field_names
+    assert names
+    if "t" not in names:
+        names.append("time")
+    for name in names:
+        assert getattr(data, name) == []
+        if got_numpy:
+            assert data.get_numpy(name).size == 0
+
+
+def test_numpy_dtypes():
+    """Numpy arrays are float64 for floats and time, and int64 for integer fields."""
+    pytest.importorskip("numpy")
+    data_infos = biologic.DataInfos()
+    data_infos.TechniqueID = 113  # SPEIS, with integer 'step' field
+    data_infos.ProcessIndex = 0
+    data_infos.NbRows = 2
+    data_infos.NbCols = 5
+    current_values = biologic.CurrentValues()
+    current_values.TimeBase = 2.5e-5
+    c_databuffer = (biologic.c_uint32 * 1000)()
+    c_databuffer[1] = 40000  # low time word of the first point
+    c_databuffer[4] = 2**32 - 1  # largest step number
+    instrument = SimpleNamespace(series="vmp3")
+
+    data = biologic.KBIOData(c_databuffer, data_infos, current_values, instrument)
+
+    assert data.get_numpy("time").dtype == "float64"
+    assert data.get_numpy("Ewe").dtype == "float64"
+    assert data.get_numpy("step").dtype == "int64"
+    assert data.get_numpy("step").tolist() == [2**32 - 1, 0]
+    assert data.time == pytest.approx([1.0, 0.0])